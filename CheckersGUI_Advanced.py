@@ -15,9 +15,13 @@ Features:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import time
-from GameBoard.board import GameBoard
+import array
+import contextlib
+import concurrent.futures
+import threading
+from GameBoard.board import GameBoard, PLAYABLE_SQUARES, SQUARE_BIT
 from SearchToolBox.search import SearchToolBox
 from OtherStuff import OtherStuff
 
@@ -59,9 +63,33 @@ class CheckersGUIAdvanced:
         'chart_grid': '#404060'
     }
     
+    # Shared widget options, built once from COLORS instead of per widget
+    PANEL_FRAME_KW = dict(font=('Arial', 11, 'bold'), fg=COLORS['text_accent'],
+                          bg=COLORS['bg_panel'], relief=tk.GROOVE, bd=2)
+    SECTION_LABEL_KW = dict(font=('Arial', 10, 'bold'), fg=COLORS['text_light'],
+                            bg=COLORS['bg_panel'])
+    SLIDER_KW = dict(orient=tk.HORIZONTAL, bg=COLORS['bg_card'], fg=COLORS['text_light'],
+                     highlightthickness=0, length=180, width=15, troughcolor=COLORS['bg_main'])
+    SLIDER_VALUE_KW = dict(font=('Arial', 9, 'bold'), fg=COLORS['king_crown'],
+                           bg=COLORS['bg_panel'], width=5)
+    # Piece colours by side: (body fill, body outline, shadow fill, inner ring)
+    PIECE_STYLES = {
+        'w': (COLORS['white_piece'], '#333333', '#CCCCCC', '#EFEFEF'),
+        'b': (COLORS['black_piece'], '#FFFFFF', '#333333', '#444444'),
+    }
+    
     SQUARE_SIZE = 70
     PIECE_RADIUS = 28
     CROWN_SIZE = 12
+    HISTORY_MAX_LINES = 200
+    
+    # Last-move panel rows: (label, key, emoji, analytics field, value format)
+    LAST_MOVE_METRICS = [
+        ('Expanded', 'expanded', '🔍', 'NodesExpanded', '{:,}'),
+        ('Generated', 'generated', '🌳', 'NodesGenerated', '{:,}'),
+        ('Prunes', 'prunes', '✂️', 'AlphaBetaPrunes', '{:,}'),
+        ('Time', 'time', '⏱️', 'TimeUsed', '{:.3f}s')
+    ]
     
     def __init__(self, root):
         """Initialize the advanced GUI application."""
@@ -73,21 +101,39 @@ class CheckersGUIAdvanced:
         self.board = None
         self.search_agent = None
         self.selected_square = None
-        self.legal_moves = []
+        self._highlight_set = set()
+        self._cached_legal = None
+        self._cached_legal_by_start = {}
+        self._cached_legal_board = None
         self.game_active = False
         
+        # The agent searches on a worker thread so the Tk loop stays responsive
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._agent_future = None
+        self._cancel_evt = threading.Event()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         # Analytics tracking
         self.cumulative_analytics = {
-            'w': {'NodesExpanded': 0, 'NodesGenerated': 0, 'AlphaBetaPrunes': 0, 'Moves': 0},
-            'b': {'NodesExpanded': 0, 'NodesGenerated': 0, 'AlphaBetaPrunes': 0, 'Moves': 0}
+            'w': {'NodesExpanded': 0, 'NodesGenerated': 0, 'AlphaBetaPrunes': 0, 'Moves': 0, 'TimeUsed': 0.0},
+            'b': {'NodesExpanded': 0, 'NodesGenerated': 0, 'AlphaBetaPrunes': 0, 'Moves': 0, 'TimeUsed': 0.0}
         }
         self.move_history = []
-        self.analytics_history = {
-            'moves': [],
-            'nodes_expanded': [],
-            'time_per_move': [],
-            'prunes': []
-        }
+        self.analytics_history = self._new_analytics_history()
+        self._label_text_cache = {}
+        self._history_line_count = 0
+        self._history_editing = False
+        self._toast = None
+        self._toast_after = None
+        
+        # Redraw/analytics requests are coalesced into one idle callback each
+        self._redraw_scheduled = False
+        self._analytics_scheduled = False
+        self._analytics_include_charts = False
+        self._stats_dirty = False
+        self._charts_dirty = False
+        self._charts_built = False
+        self._analytics_tab = None
         
         # Build the UI
         self._build_ui()
@@ -105,6 +151,11 @@ class CheckersGUIAdvanced:
         style.configure('TNotebook.Tab', background=self.COLORS['bg_panel'], 
                        foreground=self.COLORS['text_light'], padding=[20, 10])
         style.map('TNotebook.Tab', background=[('selected', self.COLORS['bg_card'])])
+        # Named label styles for the stat cards, resolved once by Tk
+        style.configure('Card.TLabel', background=self.COLORS['bg_card'],
+                       foreground=self.COLORS['text_light'], font=('Arial', 9))
+        style.configure('CardValue.TLabel', background=self.COLORS['bg_card'],
+                       foreground=self.COLORS['king_crown'], font=('Arial', 9, 'bold'))
         
         # Tab 1: Game Board
         game_tab = tk.Frame(self.notebook, bg=self.COLORS['bg_main'])
@@ -115,7 +166,9 @@ class CheckersGUIAdvanced:
         if MATPLOTLIB_AVAILABLE:
             analytics_tab = tk.Frame(self.notebook, bg=self.COLORS['bg_main'])
             self.notebook.add(analytics_tab, text="📊 Analytics Charts")
-            self._build_analytics_tab(analytics_tab)
+            self._analytics_tab = analytics_tab
+            # Charts are built on first view and only redrawn while their tab is showing
+            self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
     def _build_game_tab(self, parent):
         """Build the game board tab."""
@@ -132,6 +185,7 @@ class CheckersGUIAdvanced:
         # Center: Game board
         board_frame = tk.Frame(main_frame, bg=self.COLORS['bg_main'])
         board_frame.pack(side=tk.LEFT, padx=10)
+        self.board_frame = board_frame
         
         # Title with gradient effect
         title_frame = tk.Frame(board_frame, bg=self.COLORS['bg_main'])
@@ -161,12 +215,14 @@ class CheckersGUIAdvanced:
         canvas_frame = tk.Frame(board_frame, bg=self.COLORS['king_crown'], bd=3, relief=tk.RAISED)
         canvas_frame.pack()
         
-        canvas_size = self.SQUARE_SIZE * 8
+        canvas_size = self._board_px = self.SQUARE_SIZE * 8
         self.canvas = tk.Canvas(canvas_frame, width=canvas_size, height=canvas_size,
                                bg=self.COLORS['bg_main'], highlightthickness=0)
         self.canvas.pack()
+        self._init_board_items()
         self.canvas.bind('<Button-1>', self._on_square_click)
         self.canvas.bind('<Motion>', self._on_mouse_motion)
+        self.canvas.bind('<Leave>', self._on_mouse_leave)
         
         # Coordinate labels
         coord_frame = tk.Frame(board_frame, bg=self.COLORS['bg_main'])
@@ -184,18 +240,12 @@ class CheckersGUIAdvanced:
         
     def _build_config_panel(self, parent):
         """Build the configuration panel."""
-        config_frame = tk.LabelFrame(parent, text="⚙️ Game Configuration", 
-                                     font=('Arial', 11, 'bold'),
-                                     fg=self.COLORS['text_accent'],
-                                     bg=self.COLORS['bg_panel'],
-                                     relief=tk.GROOVE, bd=2)
+        config_frame = tk.LabelFrame(parent, text="⚙️ Game Configuration", **self.PANEL_FRAME_KW)
         config_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Strategy selection with radio buttons
-        tk.Label(config_frame, text="AI Strategy:", 
-                font=('Arial', 10, 'bold'),
-                fg=self.COLORS['text_light'],
-                bg=self.COLORS['bg_panel']).grid(row=0, column=0, sticky='w', padx=10, pady=8)
+        tk.Label(config_frame, text="AI Strategy:",
+                 **self.SECTION_LABEL_KW).grid(row=0, column=0, sticky='w', padx=10, pady=8)
         
         self.strategy_var = tk.StringVar(value="AlphaBetaOrdering")
         strategies = [
@@ -204,61 +254,46 @@ class CheckersGUIAdvanced:
             ("🎯 AB + Ordering (Best)", "AlphaBetaOrdering")
         ]
         
+        radio_kw = dict(font=('Arial', 9),
+                        fg=self.COLORS['text_light'],
+                        bg=self.COLORS['bg_panel'],
+                        selectcolor=self.COLORS['bg_card'],
+                        activebackground=self.COLORS['bg_panel'],
+                        activeforeground=self.COLORS['text_accent'])
         for i, (text, value) in enumerate(strategies):
             rb = tk.Radiobutton(config_frame, text=text, variable=self.strategy_var,
-                          value=value, font=('Arial', 9),
-                          fg=self.COLORS['text_light'],
-                          bg=self.COLORS['bg_panel'],
-                          selectcolor=self.COLORS['bg_card'],
-                          activebackground=self.COLORS['bg_panel'],
-                          activeforeground=self.COLORS['text_accent'])
+                                value=value, **radio_kw)
             rb.grid(row=i+1, column=0, sticky='w', padx=25, pady=3)
         
         # Time limit slider
-        tk.Label(config_frame, text="⏱️ Time Limit:", 
-                font=('Arial', 10, 'bold'),
-                fg=self.COLORS['text_light'],
-                bg=self.COLORS['bg_panel']).grid(row=4, column=0, sticky='w', padx=10, pady=(10, 5))
+        tk.Label(config_frame, text="⏱️ Time Limit:",
+                 **self.SECTION_LABEL_KW).grid(row=4, column=0, sticky='w', padx=10, pady=(10, 5))
         
         self.time_var = tk.DoubleVar(value=2.0)
         time_frame = tk.Frame(config_frame, bg=self.COLORS['bg_panel'])
         time_frame.grid(row=5, column=0, padx=20, pady=5, sticky='ew')
         
         time_scale = tk.Scale(time_frame, from_=1.0, to=3.0, resolution=0.5,
-                            variable=self.time_var, orient=tk.HORIZONTAL,
-                            bg=self.COLORS['bg_card'], fg=self.COLORS['text_light'],
-                            highlightthickness=0, length=180, width=15,
-                            troughcolor=self.COLORS['bg_main'])
+                              variable=self.time_var, **self.SLIDER_KW)
         time_scale.pack(side=tk.LEFT)
         
-        self.time_label = tk.Label(time_frame, text="2.0s", 
-                                   font=('Arial', 9, 'bold'),
-                                   fg=self.COLORS['king_crown'],
-                                   bg=self.COLORS['bg_panel'], width=5)
+        self.time_label = tk.Label(time_frame, text="2.0s", **self.SLIDER_VALUE_KW)
         self.time_label.pack(side=tk.LEFT, padx=5)
         self.time_var.trace('w', lambda *args: self.time_label.config(text=f"{self.time_var.get():.1f}s"))
         
         # Max plies slider
-        tk.Label(config_frame, text="🎲 Search Depth:", 
-                font=('Arial', 10, 'bold'),
-                fg=self.COLORS['text_light'],
-                bg=self.COLORS['bg_panel']).grid(row=6, column=0, sticky='w', padx=10, pady=(10, 5))
+        tk.Label(config_frame, text="🎲 Search Depth:",
+                 **self.SECTION_LABEL_KW).grid(row=6, column=0, sticky='w', padx=10, pady=(10, 5))
         
         self.ply_var = tk.IntVar(value=6)
         ply_frame = tk.Frame(config_frame, bg=self.COLORS['bg_panel'])
         ply_frame.grid(row=7, column=0, padx=20, pady=5, sticky='ew')
         
         ply_scale = tk.Scale(ply_frame, from_=5, to=9, resolution=1,
-                           variable=self.ply_var, orient=tk.HORIZONTAL,
-                           bg=self.COLORS['bg_card'], fg=self.COLORS['text_light'],
-                           highlightthickness=0, length=180, width=15,
-                           troughcolor=self.COLORS['bg_main'])
+                             variable=self.ply_var, **self.SLIDER_KW)
         ply_scale.pack(side=tk.LEFT)
         
-        self.ply_label = tk.Label(ply_frame, text="6", 
-                                 font=('Arial', 9, 'bold'),
-                                 fg=self.COLORS['king_crown'],
-                                 bg=self.COLORS['bg_panel'], width=5)
+        self.ply_label = tk.Label(ply_frame, text="6", **self.SLIDER_VALUE_KW)
         self.ply_label.pack(side=tk.LEFT, padx=5)
         self.ply_var.trace('w', lambda *args: self.ply_label.config(text=str(self.ply_var.get())))
         
@@ -280,11 +315,7 @@ class CheckersGUIAdvanced:
         
     def _build_quick_stats_panel(self, parent):
         """Build quick statistics panel."""
-        stats_frame = tk.LabelFrame(parent, text="📈 Quick Stats", 
-                                   font=('Arial', 11, 'bold'),
-                                   fg=self.COLORS['text_accent'],
-                                   bg=self.COLORS['bg_panel'],
-                                   relief=tk.GROOVE, bd=2)
+        stats_frame = tk.LabelFrame(parent, text="📈 Quick Stats", **self.PANEL_FRAME_KW)
         stats_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create stat cards
@@ -296,29 +327,27 @@ class CheckersGUIAdvanced:
             ('Avg Time/Move', 'time', '⏱️')
         ]
         
+        card_bg = self.COLORS['bg_card']
+        crown = self.COLORS['king_crown']
+        accent = self.COLORS['text_accent']
         for label, key, emoji in stats:
-            card = tk.Frame(stats_frame, bg=self.COLORS['bg_card'], relief=tk.RAISED, bd=2)
+            card = tk.Frame(stats_frame, bg=card_bg, relief=tk.RAISED, bd=2)
             card.pack(fill=tk.X, padx=5, pady=5)
             
             tk.Label(card, text=emoji, font=('Arial', 16),
-                    bg=self.COLORS['bg_card'], fg=self.COLORS['king_crown']).pack(pady=(5, 0))
+                    bg=card_bg, fg=crown).pack(pady=(5, 0))
             
-            tk.Label(card, text=label, font=('Arial', 9),
-                    fg=self.COLORS['text_light'], bg=self.COLORS['bg_card']).pack()
+            ttk.Label(card, text=label, style='Card.TLabel').pack()
             
             value_label = tk.Label(card, text="0", font=('Arial', 16, 'bold'),
-                                  fg=self.COLORS['text_accent'], bg=self.COLORS['bg_card'])
+                                  fg=accent, bg=card_bg)
             value_label.pack(pady=(0, 5))
             
             self.stat_cards[key] = value_label
         
     def _build_history_panel(self, parent):
         """Build the move history panel."""
-        history_frame = tk.LabelFrame(parent, text="📜 Move History", 
-                                     font=('Arial', 11, 'bold'),
-                                     fg=self.COLORS['text_accent'],
-                                     bg=self.COLORS['bg_panel'],
-                                     relief=tk.GROOVE, bd=2)
+        history_frame = tk.LabelFrame(parent, text="📜 Move History", **self.PANEL_FRAME_KW)
         history_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
         
         # Scrollable text widget
@@ -347,34 +376,19 @@ class CheckersGUIAdvanced:
         
     def _build_last_move_details(self, parent):
         """Build last move details panel."""
-        details_frame = tk.LabelFrame(parent, text="🎯 Last Agent Move", 
-                                     font=('Arial', 11, 'bold'),
-                                     fg=self.COLORS['text_accent'],
-                                     bg=self.COLORS['bg_panel'],
-                                     relief=tk.GROOVE, bd=2)
+        details_frame = tk.LabelFrame(parent, text="🎯 Last Agent Move", **self.PANEL_FRAME_KW)
         details_frame.pack(fill=tk.X, padx=10, pady=(5, 10))
         
         self.last_move_labels = {}
-        metrics = [
-            ('Expanded', 'expanded', '🔍'),
-            ('Generated', 'generated', '🌳'),
-            ('Prunes', 'prunes', '✂️'),
-            ('Time', 'time', '⏱️')
-        ]
-        
-        for i, (label, key, emoji) in enumerate(metrics):
-            row = tk.Frame(details_frame, bg=self.COLORS['bg_card'])
+        card_bg = self.COLORS['bg_card']
+        for label, key, emoji, _, _ in self.LAST_MOVE_METRICS:
+            row = tk.Frame(details_frame, bg=card_bg)
             row.pack(fill=tk.X, padx=5, pady=2)
             
-            tk.Label(row, text=f"{emoji} {label}:", 
-                    font=('Arial', 9),
-                    fg=self.COLORS['text_light'],
-                    bg=self.COLORS['bg_card']).pack(side=tk.LEFT, padx=5)
+            ttk.Label(row, text=f"{emoji} {label}:",
+                     style='Card.TLabel').pack(side=tk.LEFT, padx=5)
             
-            value_label = tk.Label(row, text="0", 
-                                  font=('Arial', 9, 'bold'),
-                                  fg=self.COLORS['king_crown'],
-                                  bg=self.COLORS['bg_card'])
+            value_label = ttk.Label(row, text="0", style='CardValue.TLabel')
             value_label.pack(side=tk.RIGHT, padx=5)
             self.last_move_labels[key] = value_label
         
@@ -388,96 +402,153 @@ class CheckersGUIAdvanced:
             return
         
         # Create figure with subplots
-        self.fig = Figure(figsize=(12, 8), facecolor=self.COLORS['bg_main'])
+        self.fig = Figure(figsize=(8, 6), dpi=80, facecolor=self.COLORS['bg_main'])
         
         # Create 2x2 grid of subplots
         self.ax_nodes = self.fig.add_subplot(221, facecolor=self.COLORS['chart_bg'])
         self.ax_time = self.fig.add_subplot(222, facecolor=self.COLORS['chart_bg'])
         self.ax_prunes = self.fig.add_subplot(223, facecolor=self.COLORS['chart_bg'])
         self.ax_cumulative = self.fig.add_subplot(224, facecolor=self.COLORS['chart_bg'])
-        
-        # Style all subplots
-        for ax in [self.ax_nodes, self.ax_time, self.ax_prunes, self.ax_cumulative]:
+        self._chart_axes = [self.ax_nodes, self.ax_time, self.ax_prunes, self.ax_cumulative]
+        
+        # Titles, labels and styling are static; set them once
+        chart_text = [
+            (self.ax_nodes, 'Nodes Expanded per Move', 'Nodes'),
+            (self.ax_time, 'Time per Move', 'Seconds'),
+            (self.ax_prunes, 'Alpha-Beta Prunes per Move', 'Prunes'),
+            (self.ax_cumulative, 'Cumulative Statistics', 'Count'),
+        ]
+        for ax, title, ylabel in chart_text:
+            ax.set_title(title, color=self.COLORS['text_light'], fontsize=12, fontweight='bold')
+            ax.set_xlabel('Move Number', color=self.COLORS['text_light'])
+            ax.set_ylabel(ylabel, color=self.COLORS['text_light'])
             ax.grid(True, alpha=0.3, color=self.COLORS['chart_grid'])
             ax.tick_params(colors=self.COLORS['text_light'])
             for spine in ax.spines.values():
                 spine.set_color(self.COLORS['chart_grid'])
         
+        # Persistent line artists; updates only swap their data. They are
+        # animated so full draws leave them out of the cached backgrounds.
+        line_kw = dict(linewidth=2, animated=True)
+        self._nodes_line, = self.ax_nodes.plot([], [], 'o-', color='#00D9FF', markersize=6,
+                                               label='Nodes Expanded', **line_kw)
+        self._time_line, = self.ax_time.plot([], [], 's-', color='#00E676', markersize=6,
+                                             label='Time (s)', **line_kw)
+        self._prunes_line, = self.ax_prunes.plot([], [], '^-', color='#FFD700', markersize=6,
+                                                 label='Prunes', **line_kw)
+        self._cum_nodes_line, = self.ax_cumulative.plot([], [], 'o-', color='#00D9FF', markersize=5,
+                                                        label='Cumulative Nodes', **line_kw)
+        self._cum_prunes_line, = self.ax_cumulative.plot([], [], 's-', color='#FFD700', markersize=5,
+                                                         label='Cumulative Prunes', **line_kw)
+        self._chart_lines = [
+            (self.ax_nodes, [self._nodes_line]),
+            (self.ax_time, [self._time_line]),
+            (self.ax_prunes, [self._prunes_line]),
+            (self.ax_cumulative, [self._cum_nodes_line, self._cum_prunes_line]),
+        ]
+        self.ax_cumulative.legend(facecolor=self.COLORS['bg_card'], edgecolor=self.COLORS['chart_grid'],
+                                  labelcolor=self.COLORS['text_light'])
+        for ax in self._chart_axes:
+            ax.set_xlim(0, 10)
+            ax.set_ylim(0, 1)
+        
         self.fig.tight_layout(pad=3.0)
         
         # Embed in tkinter
         self.chart_canvas = FigureCanvasTkAgg(self.fig, parent)
+        self._chart_backgrounds = None
+        self._chart_points_fitted = 0
+        self._chart_fitted_history = None
+        self.chart_canvas.mpl_connect('draw_event', self._on_chart_draw)
         self.chart_canvas.draw()
         self.chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Initial plot
         self._update_charts()
         
+    def _on_chart_draw(self, event):
+        """Cache the static chart backgrounds after a full draw and blit the lines on top."""
+        self._chart_backgrounds = [self.chart_canvas.copy_from_bbox(ax.bbox)
+                                   for ax in self._chart_axes]
+        for ax, lines in self._chart_lines:
+            for line in lines:
+                ax.draw_artist(line)
+        self.chart_canvas.blit(self.fig.bbox)
+        
+    @staticmethod
+    def _grow_chart_limits(ax, x_max, y_max):
+        """Widen an axis' limits in steps when the data outgrows them; True if they changed."""
+        changed = False
+        if x_max > ax.get_xlim()[1]:
+            ax.set_xlim(0, (int(x_max) // 10 + 1) * 10)
+            changed = True
+        if y_max > ax.get_ylim()[1]:
+            ax.set_ylim(0, y_max * 2)
+            changed = True
+        return changed
+        
     def _update_charts(self):
         """Update all analytics charts."""
         if not MATPLOTLIB_AVAILABLE:
             return
         
-        if not self.analytics_history['moves']:
+        history = self.analytics_history
+        moves = history['moves']
+        
+        self._nodes_line.set_data(moves, history['nodes_expanded'])
+        self._time_line.set_data(moves, history['time_per_move'])
+        self._prunes_line.set_data(moves, history['prunes'])
+        self._cum_nodes_line.set_data(moves, history['cumulative_nodes'])
+        self._cum_prunes_line.set_data(moves, history['cumulative_prunes'])
+        
+        # Rescale only when the data leaves the current view; a new game shrinks it back
+        needs_full_draw = self._chart_backgrounds is None
+        start = self._chart_points_fitted
+        if history is not self._chart_fitted_history or not moves:
+            # New game (fresh history dict): fall back to the default view and refit
+            for ax in self._chart_axes:
+                ax.set_xlim(0, 10)
+                ax.set_ylim(0, 1)
+            self._chart_fitted_history = history
+            start = 0
+            needs_full_draw = True
+        if start < len(moves):
+            # Limits only grow within a game, so points already fitted are
+            # skipped; while the tab is hidden several new points can queue up
+            for ax, lines in self._chart_lines:
+                y_max = max(max(line.get_ydata()[start:]) for line in lines)
+                if self._grow_chart_limits(ax, moves[-1], y_max):
+                    needs_full_draw = True
+        self._chart_points_fitted = len(moves)
+        
+        if needs_full_draw:
+            # The draw_event handler re-caches backgrounds and blits the lines
+            self._chart_backgrounds = None
+            self.chart_canvas.draw_idle()
             return
         
-        moves = self.analytics_history['moves']
-        
-        # Chart 1: Nodes Expanded per Move
-        self.ax_nodes.clear()
-        self.ax_nodes.plot(moves, self.analytics_history['nodes_expanded'], 
-                          'o-', color='#00D9FF', linewidth=2, markersize=6, label='Nodes Expanded')
-        self.ax_nodes.set_title('Nodes Expanded per Move', color=self.COLORS['text_light'], fontsize=12, fontweight='bold')
-        self.ax_nodes.set_xlabel('Move Number', color=self.COLORS['text_light'])
-        self.ax_nodes.set_ylabel('Nodes', color=self.COLORS['text_light'])
-        self.ax_nodes.grid(True, alpha=0.3, color=self.COLORS['chart_grid'])
-        self.ax_nodes.set_facecolor(self.COLORS['chart_bg'])
-        
-        # Chart 2: Time per Move
-        self.ax_time.clear()
-        self.ax_time.plot(moves, self.analytics_history['time_per_move'], 
-                         's-', color='#00E676', linewidth=2, markersize=6, label='Time (s)')
-        self.ax_time.set_title('Time per Move', color=self.COLORS['text_light'], fontsize=12, fontweight='bold')
-        self.ax_time.set_xlabel('Move Number', color=self.COLORS['text_light'])
-        self.ax_time.set_ylabel('Seconds', color=self.COLORS['text_light'])
-        self.ax_time.grid(True, alpha=0.3, color=self.COLORS['chart_grid'])
-        self.ax_time.set_facecolor(self.COLORS['chart_bg'])
-        
-        # Chart 3: Prunes per Move
-        self.ax_prunes.clear()
-        self.ax_prunes.plot(moves, self.analytics_history['prunes'], 
-                           '^-', color='#FFD700', linewidth=2, markersize=6, label='Prunes')
-        self.ax_prunes.set_title('Alpha-Beta Prunes per Move', color=self.COLORS['text_light'], fontsize=12, fontweight='bold')
-        self.ax_prunes.set_xlabel('Move Number', color=self.COLORS['text_light'])
-        self.ax_prunes.set_ylabel('Prunes', color=self.COLORS['text_light'])
-        self.ax_prunes.grid(True, alpha=0.3, color=self.COLORS['chart_grid'])
-        self.ax_prunes.set_facecolor(self.COLORS['chart_bg'])
-        
-        # Chart 4: Cumulative Comparison
-        self.ax_cumulative.clear()
-        move_nums = list(range(1, len(moves) + 1))
-        cumulative_nodes = [sum(self.analytics_history['nodes_expanded'][:i+1]) for i in range(len(moves))]
-        cumulative_prunes = [sum(self.analytics_history['prunes'][:i+1]) for i in range(len(moves))]
-        
-        self.ax_cumulative.plot(move_nums, cumulative_nodes, 'o-', 
-                               color='#00D9FF', linewidth=2, markersize=5, label='Cumulative Nodes')
-        self.ax_cumulative.plot(move_nums, cumulative_prunes, 's-', 
-                               color='#FFD700', linewidth=2, markersize=5, label='Cumulative Prunes')
-        self.ax_cumulative.set_title('Cumulative Statistics', color=self.COLORS['text_light'], fontsize=12, fontweight='bold')
-        self.ax_cumulative.set_xlabel('Move Number', color=self.COLORS['text_light'])
-        self.ax_cumulative.set_ylabel('Count', color=self.COLORS['text_light'])
-        self.ax_cumulative.legend(facecolor=self.COLORS['bg_card'], edgecolor=self.COLORS['chart_grid'],
-                                 labelcolor=self.COLORS['text_light'])
-        self.ax_cumulative.grid(True, alpha=0.3, color=self.COLORS['chart_grid'])
-        self.ax_cumulative.set_facecolor(self.COLORS['chart_bg'])
-        
-        # Apply styling to all axes
-        for ax in [self.ax_nodes, self.ax_time, self.ax_prunes, self.ax_cumulative]:
-            ax.tick_params(colors=self.COLORS['text_light'])
-            for spine in ax.spines.values():
-                spine.set_color(self.COLORS['chart_grid'])
-        
-        self.chart_canvas.draw()
+        for background, (ax, lines) in zip(self._chart_backgrounds, self._chart_lines):
+            self.chart_canvas.restore_region(background)
+            for line in lines:
+                ax.draw_artist(line)
+            self.chart_canvas.blit(ax.bbox)
+        
+    @staticmethod
+    def _new_analytics_history():
+        """Return empty per-move analytics series.
+        
+        Each series is a typed array.array: it grows by amortized doubling and
+        exposes a contiguous buffer that the charts convert without a per-item walk.
+        """
+        return {
+            'moves': array.array('q'),
+            'nodes_expanded': array.array('q'),
+            'time_per_move': array.array('d'),
+            'prunes': array.array('q'),
+            # Running totals, extended per move instead of re-summed per redraw
+            'cumulative_nodes': array.array('q'),
+            'cumulative_prunes': array.array('q')
+        }
         
     def _start_new_game(self):
         """Start a new game with current configuration."""
@@ -489,191 +560,415 @@ class CheckersGUIAdvanced:
         self.board = GameBoard()
         self.search_agent = SearchToolBox(Strategy=strategy, TimeLimit=time_limit, MaxPly=max_ply)
         self.selected_square = None
-        self.legal_moves = []
+        self._highlight_set = set()
+        self._cached_legal_board = None
         self.game_active = True
+        self._cancel_search()  # stop any search still running for the old game
         
-        # Reset analytics
-        self.cumulative_analytics = {
-            'w': {'NodesExpanded': 0, 'NodesGenerated': 0, 'AlphaBetaPrunes': 0, 'Moves': 0},
-            'b': {'NodesExpanded': 0, 'NodesGenerated': 0, 'AlphaBetaPrunes': 0, 'Moves': 0}
-        }
+        # Reset analytics in place
+        for side in ('w', 'b'):
+            data = self.cumulative_analytics[side]
+            data['Moves'] = data['NodesExpanded'] = data['NodesGenerated'] = data['AlphaBetaPrunes'] = 0
+            data['TimeUsed'] = 0.0
         self.move_history = []
-        self.analytics_history = {
-            'moves': [],
-            'nodes_expanded': [],
-            'time_per_move': [],
-            'prunes': []
-        }
-        
-        # Clear history display
-        self.history_text.config(state=tk.NORMAL)
-        self.history_text.delete(1.0, tk.END)
-        self.history_text.config(state=tk.DISABLED)
+        self.analytics_history = self._new_analytics_history()
         
         # Update status
-        self.status_label.config(text="⚪ Your Turn - White", fg=self.COLORS['success'])
-        
-        # Add game start to history
-        self._add_history_message("=" * 35 + "\n", 'header')
-        self._add_history_message("🎮 GAME STARTED\n", 'header')
-        self._add_history_message("=" * 35 + "\n", 'header')
-        self._add_history_message(f"Strategy: {strategy}\n", 'analytics')
-        self._add_history_message(f"Time: {time_limit}s | Depth: {max_ply}\n\n", 'analytics')
-        
-        # Draw board
+        self.status_label.config(text="⚪ Your Turn (White) - click a piece", fg=self.COLORS['success'])
+        self.canvas.delete('overlay')
+        
+        # Clear the history and log the game start in one widget unlock
+        with self._history_edit():
+            self.history_text.delete(1.0, tk.END)
+            self._history_line_count = 0
+            self._add_history_batch([
+                ("=" * 35 + "\n", 'header'),
+                ("🎮 GAME STARTED\n", 'header'),
+                ("=" * 35 + "\n", 'header'),
+                (f"Strategy: {strategy}\n", 'analytics'),
+                (f"Time: {time_limit}s | Depth: {max_ply}\n\n", 'analytics'),
+            ])
+        
+        # Draw board, stats and charts on the next idle cycle
         self._draw_board()
-        
-        # Update stats
-        self._update_quick_stats()
-        
-        # Update charts
-        if MATPLOTLIB_AVAILABLE:
-            self._update_charts()
-        
-        messagebox.showinfo("🎮 Game Started", 
-                           f"New game started!\n\n"
-                           f"⚪ You are White\n"
-                           f"⚫ Agent is Black\n\n"
-                           f"🎯 Click a piece to select\n"
-                           f"🎯 Then click destination\n\n"
-                           f"Strategy: {strategy}\n"
-                           f"Time: {time_limit}s | Depth: {max_ply}")
-        
-    def _draw_board(self):
-        """Draw the current board state with enhanced graphics."""
-        self.canvas.delete('all')
-        
-        # Draw squares with shadow effect
+        self._schedule_analytics_update(include_charts=True)
+        
+        self._show_toast(f"🎮 New game started - you are ⚪ White\n"
+                         f"Strategy: {strategy} | Time: {time_limit}s | Depth: {max_ply}")
+        
+    def _show_toast(self, text, duration_ms=3000):
+        """Show a non-modal notice above the board (over the title) that dismisses itself."""
+        self._dismiss_toast()
+        toast = tk.Frame(self.board_frame, bg=self.COLORS['bg_card'], relief=tk.RAISED, bd=2)
+        tk.Label(toast, text=text, font=('Arial', 11, 'bold'),
+                fg=self.COLORS['text_accent'], bg=self.COLORS['bg_card'],
+                padx=15, pady=8, justify=tk.CENTER).pack()
+        toast.place(relx=0.5, y=0, anchor=tk.N)
+        self._toast = toast
+        self._toast_after = self.root.after(duration_ms, self._dismiss_toast)
+        
+    def _dismiss_toast(self):
+        """Remove the toast, if any, and cancel its pending dismissal."""
+        if self._toast_after is not None:
+            self.root.after_cancel(self._toast_after)
+            self._toast_after = None
+        if self._toast is not None:
+            self._toast.destroy()
+            self._toast = None
+        
+    def _show_game_over_overlay(self, title, lines):
+        """Draw the game-over summary on the canvas instead of a modal dialog."""
+        size = self.SQUARE_SIZE * 8
+        self.canvas.delete('overlay')
+        self.canvas.create_rectangle(size * 0.15, size * 0.25, size * 0.85, size * 0.75,
+                                     fill=self.COLORS['bg_card'], outline=self.COLORS['king_crown'],
+                                     width=3, stipple='gray75', tags='overlay')
+        self.canvas.create_text(size / 2, size * 0.33, text=title,
+                                font=('Arial', 18, 'bold'), fill=self.COLORS['king_crown'],
+                                tags='overlay')
+        self.canvas.create_text(size / 2, size * 0.53, text="\n".join(lines),
+                                font=('Arial', 11), fill=self.COLORS['text_light'],
+                                justify=tk.CENTER, tags='overlay')
+        
+    def _init_board_items(self):
+        """Create the persistent square, outline and piece items once."""
+        self._square_ids = [[None] * 8 for _ in range(8)]
+        self._dest_outline_ids = [[None] * 8 for _ in range(8)]
+        self._piece_ids = {}
+        self._prev_square_color = [[None] * 8 for _ in range(8)]
+        self._prev_dest = [[False] * 8 for _ in range(8)]
+        self._drawn_bitboards = (0, 0, 0, 0)
+        self._drawn_selected = None
+        self._drawn_highlights = frozenset()
+        # Tcl command prefix for batched item updates in _do_redraw
+        self._canvas_config_prefix = f'{self.canvas} itemconfigure '
+        
+        # Precompute every square, piece and crown coordinate once
+        size = self.CROWN_SIZE
+        radius = self.PIECE_RADIUS
+        self._square_bbox = [[None] * 8 for _ in range(8)]
+        self._piece_bbox = [[None] * 8 for _ in range(8)]
+        self._crown_points = [[None] * 8 for _ in range(8)]
+        self._base_sq_color = [[self.COLORS['light_square'] if (row + col) % 2 == 0
+                                else self.COLORS['dark_square'] for col in range(8)]
+                               for row in range(8)]
         for row in range(8):
             for col in range(8):
                 x1 = col * self.SQUARE_SIZE
                 y1 = row * self.SQUARE_SIZE
-                x2 = x1 + self.SQUARE_SIZE
-                y2 = y1 + self.SQUARE_SIZE
-                
-                # Determine square color
-                if (row + col) % 2 == 0:
-                    color = self.COLORS['light_square']
+                self._square_bbox[row][col] = (x1, y1, x1 + self.SQUARE_SIZE, y1 + self.SQUARE_SIZE)
+                cx = x1 + self.SQUARE_SIZE // 2
+                cy = y1 + self.SQUARE_SIZE // 2
+                self._piece_bbox[row][col] = (cx - radius, cy - radius, cx + radius, cy + radius)
+                self._crown_points[row][col] = (
+                    cx - size, cy + size//2,
+                    cx - size//2, cy - size//2,
+                    cx, cy,
+                    cx + size//2, cy - size//2,
+                    cx + size, cy + size//2,
+                    cx + size*0.8, cy + size,
+                    cx, cy + size//2,
+                    cx - size*0.8, cy + size
+                )
+        
+        # The checkerboard never changes, so it is rendered once into an image
+        # and shown as a single canvas item under everything else
+        board_px = self.SQUARE_SIZE * 8
+        self._board_image = tk.PhotoImage(width=board_px, height=board_px)
+        for row in range(8):
+            for col in range(8):
+                self._board_image.put(self._base_sq_color[row][col], to=self._square_bbox[row][col])
+                self._prev_square_color[row][col] = self._base_sq_color[row][col]
+        self.canvas.create_image(0, 0, image=self._board_image, anchor='nw')
+        
+        # Selection/destination tints, only needed on playable squares; hidden
+        # while a square shows its base colour
+        for row, col in PLAYABLE_SQUARES:
+            x1, y1, x2, y2 = self._square_bbox[row][col]
+            self._square_ids[row][col] = self.canvas.create_rectangle(
+                x1, y1, x2, y2, outline='', state='hidden')
+        
+        # Legal destination borders, hidden until needed
+        for row in range(8):
+            for col in range(8):
+                x1, y1, x2, y2 = self._square_bbox[row][col]
+                self._dest_outline_ids[row][col] = self.canvas.create_rectangle(
+                    x1+2, y1+2, x2-2, y2-2, outline=self.COLORS['success'],
+                    width=3, state='hidden', tags='dest')
+        
+        # Hover border, moved to whichever square is under the cursor
+        self._hover_rect = self.canvas.create_rectangle(0, 0, 0, 0, outline=self.COLORS['text_accent'],
+                                                        width=2, state='hidden')
+        self._hover_square = None
+        self._hover_pending = False
+        
+        # Piece items exist only on the playable (dark) squares
+        for row in range(8):
+            for col in range(8):
+                if (row + col) % 2 == 1:
+                    self._piece_ids[(row, col)] = self._create_piece_items(row, col)
+        
+    def _create_piece_items(self, row, col):
+        """Create the hidden shadow, body, highlight and crown items for a square.
+        
+        Every item is tagged with the square's piece tag so the whole piece can be
+        hidden with one call; the crown items additionally share a crown tag.
+        """
+        x1, y1, x2, y2 = self._piece_bbox[row][col]
+        piece_tag = f'piece{row}{col}'
+        crown_tag = f'crown{row}{col}'
+        
+        shadow = self.canvas.create_oval(x1 + 2, y1 + 2, x2 + 2, y2 + 2,
+                                         outline='', state='hidden', tags=piece_tag)
+        body = self.canvas.create_oval(x1, y1, x2, y2, width=3, state='hidden', tags=piece_tag)
+        # Inner ring for the 3D effect, inset 6px from the body
+        inner = self.canvas.create_oval(x1 + 6, y1 + 6, x2 - 6, y2 - 6,
+                                        fill='', width=2, state='hidden', tags=piece_tag)
+        self._create_crown_items(row, col, (piece_tag, crown_tag))
+        return (shadow, body, inner, piece_tag, crown_tag)
+        
+    def _draw_board(self):
+        """Request a board redraw; repeated requests before the next idle cycle paint once."""
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.root.after_idle(self._do_redraw)
+    
+    def _schedule_analytics_update(self, include_charts=False):
+        """Request a quick-stats (and optionally chart) refresh on the next idle cycle."""
+        self._analytics_include_charts = self._analytics_include_charts or include_charts
+        if not self._analytics_scheduled:
+            self._analytics_scheduled = True
+            self.root.after_idle(self._do_analytics_update)
+    
+    def _do_analytics_update(self):
+        """Run the pending analytics refresh."""
+        self._analytics_scheduled = False
+        include_charts = self._analytics_include_charts
+        self._analytics_include_charts = False
+        if self._charts_visible():
+            # The stat cards are on the game tab; refresh them once it is shown again
+            self._stats_dirty = True
+        else:
+            self._update_quick_stats()
+        if include_charts and MATPLOTLIB_AVAILABLE:
+            self._charts_dirty = True
+            self._refresh_charts()
+    
+    def _charts_visible(self):
+        """Return True if the analytics tab is the selected notebook tab."""
+        return self._analytics_tab is not None and self.notebook.select() == str(self._analytics_tab)
+    
+    def _on_tab_changed(self, event):
+        """Bring the stat cards or the charts up to date when their tab is shown."""
+        if self._stats_dirty and not self._charts_visible():
+            self._stats_dirty = False
+            self._update_quick_stats()
+        self._refresh_charts()
+    
+    def _refresh_charts(self):
+        """Build the charts on first view, or update them if stale, while their tab is showing."""
+        if not self._charts_visible():
+            return
+        if not self._charts_built:
+            # Building plots the current history, so the charts start out fresh
+            self._build_analytics_tab(self._analytics_tab)
+            self._charts_built = True
+        elif self._charts_dirty:
+            self._update_charts()
+        self._charts_dirty = False
+    
+    def _do_redraw(self):
+        """Bring the persistent board items in line with the current state."""
+        self._redraw_scheduled = False
+        
+        # Only squares whose selection/highlight status changed need restyling
+        highlights = frozenset(self._highlight_set)
+        dirty = set(highlights ^ self._drawn_highlights)
+        if self.selected_square != self._drawn_selected:
+            dirty |= {self._drawn_selected, self.selected_square}
+            dirty.discard(None)
+        # Item updates are collected as Tcl commands and sent in one eval
+        cmds = []
+        conf = self._canvas_config_prefix
+        if not highlights and self._drawn_highlights:
+            # Hide every destination border with one tagged command
+            cmds.append(conf + 'dest -state hidden')
+            for row, col in self._drawn_highlights:
+                self._prev_dest[row][col] = False
+        selected = self.selected_square
+        selected_color = self.COLORS['selected']
+        highlight_color = self.COLORS['highlight']
+        for row, col in dirty:
+            # Determine square color: highlight beats selection beats base
+            is_legal_dest = (row, col) in highlights
+            if is_legal_dest:
+                color = highlight_color
+            elif selected == (row, col):
+                color = selected_color
+            else:
+                color = self._base_sq_color[row][col]
+            
+            # Only touch items whose state actually changed
+            if color != self._prev_square_color[row][col]:
+                if color == self._base_sq_color[row][col]:
+                    cmds.append(f'{conf}{self._square_ids[row][col]} -state hidden')
                 else:
-                    color = self.COLORS['dark_square']
-                
-                # Highlight selected square
-                if self.selected_square == (row, col):
-                    color = self.COLORS['selected']
-                
-                # Highlight legal move destinations
-                is_legal_dest = False
-                for move in self.legal_moves:
-                    if move['start'] == self.selected_square:
-                        for target in move['sequence']:
-                            if target == (row, col):
-                                color = self.COLORS['highlight']
-                                is_legal_dest = True
-                
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='')
-                
-                # Add subtle border to legal destinations
-                if is_legal_dest:
-                    self.canvas.create_rectangle(x1+2, y1+2, x2-2, y2-2, 
-                                                outline=self.COLORS['success'], width=3)
-        
-        # Draw pieces with enhanced graphics
-        if self.board:
-            for row in range(8):
-                for col in range(8):
-                    piece = self.board.Board[row][col]
-                    if piece:
-                        self._draw_piece_enhanced(row, col, piece)
-        
-    def _draw_piece_enhanced(self, row, col, piece):
-        """Draw a piece with enhanced graphics including shadows."""
-        center_x = col * self.SQUARE_SIZE + self.SQUARE_SIZE // 2
-        center_y = row * self.SQUARE_SIZE + self.SQUARE_SIZE // 2
-        
-        # Determine piece color
-        if piece.lower() == 'w':
-            color = self.COLORS['white_piece']
-            outline_color = '#333333'
-            shadow_color = '#CCCCCC'
+                    cmds.append(f'{conf}{self._square_ids[row][col]} -fill {color} -state normal')
+                self._prev_square_color[row][col] = color
+            if is_legal_dest != self._prev_dest[row][col]:
+                state = 'normal' if is_legal_dest else 'hidden'
+                cmds.append(f'{conf}{self._dest_outline_ids[row][col]} -state {state}')
+                self._prev_dest[row][col] = is_legal_dest
+        self._drawn_selected = self.selected_square
+        self._drawn_highlights = highlights
+        
+        # XOR the board's bitboards against the last drawn ones and visit only the changed squares
+        board = self.board
+        if board:
+            current = (board.WhiteMen, board.WhiteKings, board.BlackMen, board.BlackKings)
         else:
-            color = self.COLORS['black_piece']
-            outline_color = '#FFFFFF'
-            shadow_color = '#333333'
-        
-        # Draw shadow
-        self.canvas.create_oval(center_x - self.PIECE_RADIUS + 2,
-                               center_y - self.PIECE_RADIUS + 2,
-                               center_x + self.PIECE_RADIUS + 2,
-                               center_y + self.PIECE_RADIUS + 2,
-                               fill=shadow_color, outline='')
-        
-        # Draw piece with gradient effect
-        self.canvas.create_oval(center_x - self.PIECE_RADIUS,
-                               center_y - self.PIECE_RADIUS,
-                               center_x + self.PIECE_RADIUS,
-                               center_y + self.PIECE_RADIUS,
-                               fill=color, outline=outline_color, width=3)
-        
-        # Draw inner circle for 3D effect
-        inner_radius = self.PIECE_RADIUS - 6
-        highlight_color = '#EFEFEF' if piece.lower() == 'w' else '#444444'
-        self.canvas.create_oval(center_x - inner_radius,
-                               center_y - inner_radius,
-                               center_x + inner_radius,
-                               center_y + inner_radius,
-                               fill='', outline=highlight_color, width=2)
-        
-        # Draw crown for kings
-        if piece.isupper():
-            self._draw_crown(center_x, center_y)
-    
-    def _draw_crown(self, x, y):
-        """Draw a detailed crown for king pieces."""
+            current = (0, 0, 0, 0)
+        white_men, white_kings, black_men, black_kings = current
+        drawn_white_men, drawn_white_kings, drawn_black_men, drawn_black_kings = self._drawn_bitboards
+        changed = ((white_men ^ drawn_white_men) | (white_kings ^ drawn_white_kings)
+                   | (black_men ^ drawn_black_men) | (black_kings ^ drawn_black_kings))
+        if changed:
+            white = white_men | white_kings
+            kings = white_kings | black_kings
+            occupied = white | black_men | black_kings
+            while changed:
+                low = changed & -changed
+                row, col = PLAYABLE_SQUARES[low.bit_length() - 1]
+                if occupied & low:
+                    side = 'w' if white & low else 'b'
+                else:
+                    side = None
+                self._draw_piece_enhanced(row, col, side, kings & low, cmds)
+                changed ^= low
+            self._drawn_bitboards = current
+        
+        if cmds:
+            self.canvas.tk.eval('\n'.join(cmds))
+        
+    def _draw_piece_enhanced(self, row, col, side, is_king, cmds):
+        """Append the Tcl commands that show a square's piece items, or hide them if side is None."""
+        shadow, body, inner, piece_tag, crown_tag = self._piece_ids[(row, col)]
+        conf = self._canvas_config_prefix
+        
+        if side is None:
+            cmds.append(f'{conf}{piece_tag} -state hidden')
+            return
+        
+        color, outline_color, shadow_color, highlight_color = self.PIECE_STYLES[side]
+        cmds.append(f'{conf}{shadow} -fill {shadow_color} -state normal')
+        cmds.append(f'{conf}{body} -fill {color} -outline {outline_color} -state normal')
+        cmds.append(f'{conf}{inner} -outline {highlight_color} -state normal')
+        
+        # Crown only for kings
+        cmds.append(f'{conf}{crown_tag} -state ' + ('normal' if is_king else 'hidden'))
+    
+    def _create_crown_items(self, row, col, tags):
+        """Create a hidden detailed crown (polygon plus jewels) for a square."""
         size = self.CROWN_SIZE
-        # Crown shape
-        points = [
-            x - size, y + size//2,
-            x - size//2, y - size//2,
-            x, y,
-            x + size//2, y - size//2,
-            x + size, y + size//2,
-            x + size*0.8, y + size,
-            x, y + size//2,
-            x - size*0.8, y + size
-        ]
+        points = self._crown_points[row][col]
+        x, y = points[4], points[5]  # crown centre
         
-        # Draw crown with gradient
         self.canvas.create_polygon(points, fill=self.COLORS['king_crown'], 
-                                  outline='#DAA520', width=2)
+                                   outline='#DAA520', width=2, state='hidden', tags=tags)
         
         # Add jewel points
         for jewel_x in [x - size//2, x, x + size//2]:
             self.canvas.create_oval(jewel_x - 2, y - size//2 - 2,
-                                   jewel_x + 2, y - size//2 + 2,
-                                   fill='#FF6B6B', outline='#C92A2A')
+                                    jewel_x + 2, y - size//2 + 2,
+                                    fill='#FF6B6B', outline='#C92A2A',
+                                    state='hidden', tags=tags)
+    
+    def _is_white_piece(self, row, col):
+        """Return True if a white man or king stands on the square."""
+        return bool((self.board.WhiteMen | self.board.WhiteKings) & SQUARE_BIT.get((row, col), 0))
+    
+    def _get_legal_moves_w(self):
+        """Return White's legal moves, regenerating them only when the board changed."""
+        if self._cached_legal_board is not self.board:
+            self._cached_legal = self.board.GenerateLegalMoves('w')
+            by_start = {}
+            for move in self._cached_legal:
+                by_start.setdefault(move['start'], []).append(move)
+            self._cached_legal_by_start = by_start
+            self._cached_legal_board = self.board
+        return self._cached_legal
+    
+    def _get_legal_moves_from(self, start):
+        """Return White's legal moves that start on the given square."""
+        self._get_legal_moves_w()
+        return self._cached_legal_by_start.get(start, ())
+    
+    def _find_legal_move(self, start, target):
+        """
+        Find White's legal move from start whose first or final landing is target.
+        Mirrors GameBoard.MakeMoveIfLegal but returns the move itself.
+        """
+        for move in self._get_legal_moves_from(start):
+            if target in (move['sequence'][0], move['sequence'][-1]):
+                return move
+        return None
     
     def _on_mouse_motion(self, event):
-        """Handle mouse motion for hover effects."""
-        # Could add hover effects here if desired
-        pass
+        """Track the hovered square; the border update is coalesced into one idle callback."""
+        x, y = event.x, event.y
+        if 0 <= x < self._board_px and 0 <= y < self._board_px:
+            square = (y // self.SQUARE_SIZE, x // self.SQUARE_SIZE)
+        else:
+            square = None
+        self._set_hover_square(square)
+    
+    def _on_mouse_leave(self, event):
+        """Hide the hover border when the cursor leaves the board."""
+        self._set_hover_square(None)
+    
+    def _set_hover_square(self, square):
+        """Record the hovered square and schedule at most one border update per idle cycle."""
+        if square == self._hover_square:
+            return
+        self._hover_square = square
+        if not self._hover_pending:
+            self._hover_pending = True
+            self.root.after_idle(self._apply_hover)
+    
+    def _apply_hover(self):
+        """Move the hover border onto the hovered square, or hide it."""
+        self._hover_pending = False
+        if self._hover_square is None or not self.game_active:
+            self.canvas.itemconfigure(self._hover_rect, state='hidden')
+            return
+        row, col = self._hover_square
+        x1, y1, x2, y2 = self._square_bbox[row][col]
+        self.canvas.coords(self._hover_rect, x1 + 1, y1 + 1, x2 - 1, y2 - 1)
+        self.canvas.itemconfigure(self._hover_rect, state='normal')
+    
+    def _recompute_highlights(self):
+        """Cache the destination squares of the selected piece's legal moves."""
+        self._highlight_set = {target
+                               for move in self._get_legal_moves_from(self.selected_square)
+                               for target in move['sequence']}
     
     def _on_square_click(self, event):
         """Handle mouse click on board square."""
+        x, y, board_px = event.x, event.y, self._board_px
+        if x < 0 or y < 0 or x >= board_px or y >= board_px:
+            return
         if not self.game_active or self.board.PlayerToMove != 'w':
             return
         
-        col = event.x // self.SQUARE_SIZE
-        row = event.y // self.SQUARE_SIZE
-        
-        if not (0 <= row < 8 and 0 <= col < 8):
-            return
+        ss = self.SQUARE_SIZE
+        col = x // ss
+        row = y // ss
         
         # If no square selected, try to select this square
         if self.selected_square is None:
-            piece = self.board.Board[row][col]
-            if piece and piece.lower() == 'w':
+            if self._is_white_piece(row, col):
                 self.selected_square = (row, col)
-                self.legal_moves = self.board.GenerateLegalMoves('w')
+                self._recompute_highlights()
                 self._draw_board()
         else:
             # Try to make a move
@@ -681,21 +976,24 @@ class CheckersGUIAdvanced:
             target_row, target_col = row, col
             
             # Attempt the move
-            new_board = self.board.MakeMoveIfLegal((start_row, start_col), (target_row, target_col))
+            move = self._find_legal_move((start_row, start_col), (target_row, target_col))
             
-            if new_board is not None:
+            if move is not None:
                 # Valid move
-                self.board = new_board
+                self.board = self.board.ApplyMove(move)
+                self._cached_legal_board = None
                 self.cumulative_analytics['w']['Moves'] += 1
                 
                 # Add to history
                 move_num = self.cumulative_analytics['w']['Moves']
-                self._add_history_message(f"Move {move_num}: ", 'white')
-                self._add_history_message(f"({start_row},{start_col}) → ({target_row},{target_col})\n", None)
+                self._add_history_batch([
+                    (f"Move {move_num}: ", 'white'),
+                    (f"({start_row},{start_col}) → ({target_row},{target_col})\n", None),
+                ])
                 
                 # Clear selection
                 self.selected_square = None
-                self.legal_moves = []
+                self._highlight_set = set()
                 
                 # Check for game over
                 winner = self.board.GoalTest()
@@ -705,65 +1003,97 @@ class CheckersGUIAdvanced:
                 
                 # Update display
                 self._draw_board()
-                self._update_quick_stats()
+                self._schedule_analytics_update()
                 self.status_label.config(text="⚫ Agent Thinking...", fg=self.COLORS['warning'])
-                self.root.update()
+                self.root.update_idletasks()
                 
-                # Agent's turn
-                self.root.after(300, self._agent_move)
+                # Agent's turn: search in the background and poll for the result
+                self._agent_future = self._executor.submit(self.search_agent.ChooseMove, self.board,
+                                                           cancel=self._cancel_evt)
+                self.root.after(30, self._poll_agent, self._agent_future)
             else:
                 # Invalid move, try selecting a different piece
-                piece = self.board.Board[row][col]
-                if piece and piece.lower() == 'w':
+                if self._is_white_piece(row, col):
                     self.selected_square = (row, col)
-                    self.legal_moves = self.board.GenerateLegalMoves('w')
+                    self._recompute_highlights()
                 else:
                     self.selected_square = None
-                    self.legal_moves = []
+                    self._highlight_set = set()
                 self._draw_board()
     
-    def _agent_move(self):
-        """Execute the agent's move."""
+    def _cancel_search(self):
+        """Abort the agent's background search, if any, and arm a fresh token."""
+        if self._agent_future is not None:
+            self._cancel_evt.set()
+            self._cancel_evt = threading.Event()
+        self._agent_future = None
+    
+    def _on_close(self):
+        """Stop the agent's search before tearing down the window."""
+        self._cancel_search()
+        self._executor.shutdown(wait=False)
+        self._dismiss_toast()
+        self.root.destroy()
+    
+    def _poll_agent(self, future):
+        """Check whether the background search has finished and apply its move."""
+        if future is not self._agent_future:
+            return  # game was restarted while the agent was thinking
+        if not future.done():
+            self.root.after(30, self._poll_agent, future)
+            return
+        self._agent_future = None
+        chosen_move, analytics = future.result()
+        self._agent_move(chosen_move, analytics)
+    
+    def _agent_move(self, chosen_move, analytics):
+        """Apply the agent's chosen move and update analytics."""
         if not self.game_active:
             return
         
-        # Get agent's move
-        chosen_move, analytics = self.search_agent.ChooseMove(self.board)
-        
         if chosen_move is None:
             self._game_over('w')
             return
         
         # Apply move
         self.board = self.board.ApplyMove(chosen_move)
+        self._cached_legal_board = None
         
         # Update analytics
-        self.cumulative_analytics['b']['NodesExpanded'] += analytics['NodesExpanded']
-        self.cumulative_analytics['b']['NodesGenerated'] += analytics['NodesGenerated']
-        self.cumulative_analytics['b']['AlphaBetaPrunes'] += analytics['AlphaBetaPrunes']
-        self.cumulative_analytics['b']['Moves'] += 1
+        b_data = self.cumulative_analytics['b']
+        b_data['NodesExpanded'] += analytics['NodesExpanded']
+        b_data['NodesGenerated'] += analytics['NodesGenerated']
+        b_data['AlphaBetaPrunes'] += analytics['AlphaBetaPrunes']
+        b_data['Moves'] += 1
+        b_data['TimeUsed'] += analytics['TimeUsed']
         
         # Record analytics history
-        self.analytics_history['moves'].append(self.cumulative_analytics['b']['Moves'])
+        self.analytics_history['moves'].append(b_data['Moves'])
         self.analytics_history['nodes_expanded'].append(analytics['NodesExpanded'])
         self.analytics_history['time_per_move'].append(analytics['TimeUsed'])
         self.analytics_history['prunes'].append(analytics['AlphaBetaPrunes'])
+        cumulative_nodes = self.analytics_history['cumulative_nodes']
+        cumulative_prunes = self.analytics_history['cumulative_prunes']
+        cumulative_nodes.append((cumulative_nodes[-1] if cumulative_nodes else 0)
+                                + analytics['NodesExpanded'])
+        cumulative_prunes.append((cumulative_prunes[-1] if cumulative_prunes else 0)
+                                 + analytics['AlphaBetaPrunes'])
         
         # Update last move analytics
-        self.last_move_labels['expanded'].config(text=f"{analytics['NodesExpanded']:,}")
-        self.last_move_labels['generated'].config(text=f"{analytics['NodesGenerated']:,}")
-        self.last_move_labels['prunes'].config(text=f"{analytics['AlphaBetaPrunes']:,}")
-        self.last_move_labels['time'].config(text=f"{analytics['TimeUsed']:.3f}s")
+        for _, key, _, field, fmt in self.LAST_MOVE_METRICS:
+            self._set_label(self.last_move_labels[key], fmt.format(analytics[field]))
         
         # Add to history
-        move_num = self.cumulative_analytics['b']['Moves']
-        self._add_history_message(f"Move {move_num}: ", 'black')
+        move_num = b_data['Moves']
         start = chosen_move['start']
         seq = chosen_move['sequence'][-1]
-        self._add_history_message(f"({start[0]},{start[1]}) → ({seq[0]},{seq[1]})\n", None)
-        self._add_history_message(f"  N:{analytics['NodesExpanded']:,} | "
-                                f"P:{analytics['AlphaBetaPrunes']:,} | "
-                                f"T:{analytics['TimeUsed']:.2f}s\n", 'analytics')
+        self._add_history_batch([
+            (f"Move {move_num}: ", 'black'),
+            (f"({start[0]},{start[1]}) → ({seq[0]},{seq[1]})\n", None),
+            (f"  N:{analytics['NodesExpanded']:,} | "
+             f"P:{analytics['AlphaBetaPrunes']:,} | "
+             f"T:{analytics['TimeUsed']:.2f}s\n", 'analytics'),
+        ])
         
         # Check for game over
         winner = self.board.GoalTest()
@@ -773,36 +1103,66 @@ class CheckersGUIAdvanced:
         
         # Update display
         self._draw_board()
-        self._update_quick_stats()
-        if MATPLOTLIB_AVAILABLE:
-            self._update_charts()
+        self._schedule_analytics_update(include_charts=True)
         self.status_label.config(text="⚪ Your Turn - White", fg=self.COLORS['success'])
     
     def _update_quick_stats(self):
         """Update quick statistics display."""
-        total_moves = self.cumulative_analytics['w']['Moves'] + self.cumulative_analytics['b']['Moves']
-        total_nodes = self.cumulative_analytics['b']['NodesExpanded']
-        total_prunes = self.cumulative_analytics['b']['AlphaBetaPrunes']
+        w_data = self.cumulative_analytics['w']
+        b_data = self.cumulative_analytics['b']
         
-        self.stat_cards['moves'].config(text=str(total_moves))
-        self.stat_cards['nodes'].config(text=f"{total_nodes:,}")
-        self.stat_cards['prunes'].config(text=f"{total_prunes:,}")
+        self._set_label(self.stat_cards['moves'], str(w_data['Moves'] + b_data['Moves']))
+        self._set_label(self.stat_cards['nodes'], f"{b_data['NodesExpanded']:,}")
+        self._set_label(self.stat_cards['prunes'], f"{b_data['AlphaBetaPrunes']:,}")
         
-        if self.cumulative_analytics['b']['Moves'] > 0:
-            avg_time = sum(self.analytics_history['time_per_move']) / len(self.analytics_history['time_per_move'])
-            self.stat_cards['time'].config(text=f"{avg_time:.2f}s")
+        if b_data['Moves'] > 0:
+            avg_time = b_data['TimeUsed'] / b_data['Moves']
+            self._set_label(self.stat_cards['time'], f"{avg_time:.2f}s")
         else:
-            self.stat_cards['time'].config(text="0.00s")
+            self._set_label(self.stat_cards['time'], "0.00s")
+        
+        # Flush the batched label changes (including the last-move panel) in one pass
+        self.root.update_idletasks()
+    
+    def _set_label(self, label, text):
+        """Set a label's text, skipping the Tk call when it is unchanged."""
+        if self._label_text_cache.get(label) == text:
+            return
+        label.config(text=text)
+        self._label_text_cache[label] = text
     
-    def _add_history_message(self, message, tag=None):
-        """Add a message to the history panel."""
+    @contextlib.contextmanager
+    def _history_edit(self):
+        """Unlock the history panel once for a batch of messages."""
+        if self._history_editing:
+            yield
+            return
+        self._history_editing = True
         self.history_text.config(state=tk.NORMAL)
-        if tag:
-            self.history_text.insert(tk.END, message, tag)
-        else:
-            self.history_text.insert(tk.END, message)
-        self.history_text.see(tk.END)
-        self.history_text.config(state=tk.DISABLED)
+        try:
+            yield
+        finally:
+            self._history_editing = False
+            self.history_text.see(tk.END)
+            self.history_text.config(state=tk.DISABLED)
+    
+    def _add_history_batch(self, messages):
+        """Append (text, tag) chunks with a single Text.insert call, keeping only the newest lines."""
+        args = []
+        new_lines = 0
+        for message, tag in messages:
+            args.append(message)
+            args.append(tag or '')
+            new_lines += message.count('\n')
+        with self._history_edit():
+            self.history_text.insert(tk.END, *args)
+            
+            # Drop the oldest lines once the panel exceeds its cap
+            self._history_line_count += new_lines
+            excess = self._history_line_count - self.HISTORY_MAX_LINES
+            if excess > 0:
+                self.history_text.delete('1.0', f'{excess + 1}.0')
+                self._history_line_count -= excess
     
     def _game_over(self, winner):
         """Handle game over."""
@@ -813,50 +1173,48 @@ class CheckersGUIAdvanced:
         self.status_label.config(text=f"{winner_emoji} GAME OVER - {winner_text} Wins!", 
                                 fg=self.COLORS['king_crown'])
         
-        # Add to history
-        self._add_history_message(f"\n{'='*35}\n", 'header')
-        self._add_history_message(f"🏆 GAME OVER! 🏆\n", 'header')
-        self._add_history_message(f"Winner: {winner_text}\n", 
-                                'white' if winner == 'w' else 'black')
-        self._add_history_message(f"{'='*35}\n\n", 'header')
-        
         # Final statistics
         w_data = self.cumulative_analytics['w']
         b_data = self.cumulative_analytics['b']
         
-        stats_msg = (
-            f"📊 Final Statistics:\n\n"
-            f"⚪ White (You):\n"
-            f"  Moves: {w_data['Moves']}\n\n"
-            f"⚫ Black (Agent):\n"
-            f"  Moves: {b_data['Moves']}\n"
-            f"  Nodes Expanded: {b_data['NodesExpanded']:,}\n"
-            f"  Nodes Generated: {b_data['NodesGenerated']:,}\n"
-            f"  Alpha-Beta Prunes: {b_data['AlphaBetaPrunes']:,}\n"
-        )
-        
-        if self.analytics_history['time_per_move']:
-            avg_time = sum(self.analytics_history['time_per_move']) / len(self.analytics_history['time_per_move'])
-            stats_msg += f"  Avg Time/Move: {avg_time:.3f}s\n"
-        
-        self._add_history_message("Final Statistics:\n", 'header')
-        self._add_history_message(f"White: {w_data['Moves']} moves\n", 'white')
-        self._add_history_message(f"Black: {b_data['Moves']} moves\n", 'black')
-        self._add_history_message(f"Nodes: {b_data['NodesExpanded']:,} | "
-                                f"Prunes: {b_data['AlphaBetaPrunes']:,}\n", 'analytics')
-        
-        messagebox.showinfo("🏆 Game Over", stats_msg)
+        stats_lines = [
+            f"Winner: {winner_text}",
+            f"⚪ White moves: {w_data['Moves']} | ⚫ Black moves: {b_data['Moves']}",
+            f"Nodes Expanded: {b_data['NodesExpanded']:,} | Prunes: {b_data['AlphaBetaPrunes']:,}",
+        ]
+        
+        if b_data['Moves'] > 0:
+            avg_time = b_data['TimeUsed'] / b_data['Moves']
+            stats_lines.append(f"Avg Time/Move: {avg_time:.3f}s")
+        
+        # Add to history
+        self._add_history_batch([
+            (f"\n{'='*35}\n", 'header'),
+            ("🏆 GAME OVER! 🏆\n", 'header'),
+            (f"Winner: {winner_text}\n", 'white' if winner == 'w' else 'black'),
+            (f"{'='*35}\n\n", 'header'),
+            ("Final Statistics:\n", 'header'),
+            (f"White: {w_data['Moves']} moves\n", 'white'),
+            (f"Black: {b_data['Moves']} moves\n", 'black'),
+            (f"Nodes: {b_data['NodesExpanded']:,} | "
+             f"Prunes: {b_data['AlphaBetaPrunes']:,}\n", 'analytics'),
+        ])
+        
+        # Paint the final position, then lay the summary over it
+        self._draw_board()
+        self._show_game_over_overlay("🏆 GAME OVER 🏆", stats_lines)
 
 
 def main():
     """Main entry point for the advanced GUI application."""
     root = tk.Tk()
+    # Keep the window hidden while it is sized and built so it maps once
+    root.withdraw()
     
     # Set window size and center it
     window_width = 1600
     window_height = 900
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
+    screen_width, screen_height = root.winfo_screenwidth(), root.winfo_screenheight()
     x = (screen_width - window_width) // 2
     y = (screen_height - window_height) // 2
     root.geometry(f"{window_width}x{window_height}+{x}+{y}")
@@ -866,6 +1224,7 @@ def main():
     
     # Create the application
     app = CheckersGUIAdvanced(root)
+    root.deiconify()
     
     # Run the main loop
     root.mainloop()
@@ -4,7 +4,7 @@ GameBoard Module
 This module represents the checkers board and game state.
 
 Responsible for:
-- Storing board as 8x8 grid with items: None, 'w', 'W', 'b', 'B'
+- Storing board as bitboards over the 32 playable squares
 - Generating legal moves (with forced-capture logic)
 - Applying moves to produce successor states
 - Testing goal (one side has no pieces)
@@ -12,26 +12,290 @@ Responsible for:
 - Heuristic evaluation function
 
 Board representation:
-- 'w': White piece (human)
-- 'W': White king
-- 'b': Black piece (agent)
-- 'B': Black king
-- None: Empty square
+- Four integer bitboards: WhiteMen, WhiteKings, BlackMen, BlackKings.
+  Bit i stands for playable square i, numbered row-major: square = r*4 + c//2.
+- The Board property exposes the familiar 8x8 grid view with items:
+  - 'w': White piece (human)
+  - 'W': White king
+  - 'b': Black piece (agent)
+  - 'B': Black king
+  - None: Empty square
 """
 
-import copy
+import random
 from typing import List, Tuple, Optional
 from OtherStuff import OtherStuff
 
+# Pieces only ever stand on the 32 playable (dark) squares; index i is (r, c) of square i
+PLAYABLE_SQUARES = tuple((r, c) for r in range(8) for c in range(8) if (r + c) % 2 == 1)
+# (r, c) -> bit of that playable square
+SQUARE_BIT = {rc: 1 << sq for sq, rc in enumerate(PLAYABLE_SQUARES)}
+ALL_SQUARES = (1 << 32) - 1
+# Rows where men are promoted
+WHITE_KING_ROW = sum(1 << sq for sq, (r, c) in enumerate(PLAYABLE_SQUARES) if r == 0)
+BLACK_KING_ROW = sum(1 << sq for sq, (r, c) in enumerate(PLAYABLE_SQUARES) if r == 7)
+
+# Every evaluation term is a whole number of EVAL_UNITs, so EvaluateFor sums
+# integer popcounts and scales once: men 1.0, kings 1.8, 0.1 per legal move
+EVAL_UNIT = 0.025
+MAN_POINTS = 40
+KING_POINTS = 72
+MOBILITY_POINTS = 4
+# Center-control bonus 0.05 * (3 - (|3.5-r| + |3.5-c|)/2) in units: 6 - distance, from -1 to 5
+CENTER_POINTS = tuple(6 - int(abs(3.5 - r) + abs(3.5 - c)) for (r, c) in PLAYABLE_SQUARES)
+# Bit planes of CENTER_POINTS + 1 (0..6), so the bonus is a weighted sum of three popcounts
+CENTER_PLANES = tuple(sum(1 << sq for sq, points in enumerate(CENTER_POINTS) if (points + 1) >> bit & 1)
+                      for bit in range(3))
+
+# Diagonal directions, in the order moves are generated
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+# Zobrist keys: one random 64-bit number per (bitboard, square), plus one for black to move
+_zobrist_rng = random.Random(0x5EED_C4EC)
+ZOBRIST_PIECE = tuple(tuple(_zobrist_rng.getrandbits(64) for _ in range(32)) for _ in range(4))
+ZOBRIST_BLACK_TO_MOVE = _zobrist_rng.getrandbits(64)
+
+
+def ZobristHash(white_men: int, white_kings: int, black_men: int, black_kings: int,
+                player_to_move: str) -> int:
+    """
+    Compute the Zobrist hash of a position from scratch.
+
+    Args:
+        white_men: Bitboard of white men
+        white_kings: Bitboard of white kings
+        black_men: Bitboard of black men
+        black_kings: Bitboard of black kings
+        player_to_move: 'w' or 'b'
+
+    Returns:
+        int: 64-bit position hash
+    """
+    h = ZOBRIST_BLACK_TO_MOVE if player_to_move == 'b' else 0
+    for table, bb in zip(ZOBRIST_PIECE, (white_men, white_kings, black_men, black_kings)):
+        while bb:
+            low = bb & -bb
+            h ^= table[low.bit_length() - 1]
+            bb ^= low
+    return h
+
+
+def _BuildStepTable(directions):
+    """Per square, the (bit, (r, c)) of each on-board diagonal neighbour in the given directions."""
+    table = []
+    for (r, c) in PLAYABLE_SQUARES:
+        steps = []
+        for (dr, dc) in directions:
+            target = (r + dr, c + dc)
+            if target in SQUARE_BIT:
+                steps.append((SQUARE_BIT[target], target))
+        table.append(tuple(steps))
+    return tuple(table)
+
+
+# Simple-move targets: white men move up, black men down, kings both ways
+WHITE_MAN_STEPS = _BuildStepTable(DIRECTIONS[:2])
+BLACK_MAN_STEPS = _BuildStepTable(DIRECTIONS[2:])
+KING_STEPS = _BuildStepTable(DIRECTIONS)
+
+# Whole-board diagonal steps as shifts. On even rows (c odd) the up-left/up-right
+# neighbours are square-4/-3 and down-left/down-right +4/+5; on odd rows (c even)
+# they are -5/-4 and +3/+4. The masks drop pieces that would step off the sides.
+EVEN_ROWS = sum(1 << sq for sq, (r, c) in enumerate(PLAYABLE_SQUARES) if r % 2 == 0)
+ODD_ROWS = ALL_SQUARES & ~EVEN_ROWS
+EVEN_ROWS_NOT_RIGHT = EVEN_ROWS & ~sum(1 << sq for sq, (r, c) in enumerate(PLAYABLE_SQUARES) if c == 7)
+ODD_ROWS_NOT_LEFT = ODD_ROWS & ~sum(1 << sq for sq, (r, c) in enumerate(PLAYABLE_SQUARES) if c == 0)
+
+
+def _Jumpers(own: int, opp: int, empty: int) -> int:
+    """
+    Squares of own that can jump an opp piece into an empty square, found by
+    stepping backwards from the empty squares over opp in all four directions.
+    """
+    # Opponent pieces with an empty square behind them, per jump direction
+    e = empty & EVEN_ROWS
+    o = empty & ODD_ROWS
+    ul = opp & (((e & EVEN_ROWS_NOT_RIGHT) << 5) | (o << 4))        # jumped up-left
+    ur = opp & ((e << 4) | ((o & ODD_ROWS_NOT_LEFT) << 3))          # jumped up-right
+    dl = opp & (((e & EVEN_ROWS_NOT_RIGHT) >> 3) | (o >> 4))        # jumped down-left
+    dr = opp & ((e >> 4) | ((o & ODD_ROWS_NOT_LEFT) >> 5))          # jumped down-right
+    # ...and the own pieces one more step back
+    return own & ((((ul & EVEN_ROWS_NOT_RIGHT) << 5) | ((ul & ODD_ROWS) << 4)
+                   | ((ur & EVEN_ROWS) << 4) | ((ur & ODD_ROWS_NOT_LEFT) << 3)
+                   | ((dl & EVEN_ROWS_NOT_RIGHT) >> 3) | ((dl & ODD_ROWS) >> 4)
+                   | ((dr & EVEN_ROWS) >> 4) | ((dr & ODD_ROWS_NOT_LEFT) >> 5)))
+
+
+# Jumps from each square, in all four directions (men may capture backwards):
+# (captured bit, landing bit, landing square, captured (r, c), landing (r, c))
+JUMPS = tuple(
+    tuple((SQUARE_BIT[(r + dr, c + dc)], SQUARE_BIT[(r + 2*dr, c + 2*dc)],
+           PLAYABLE_SQUARES.index((r + 2*dr, c + 2*dc)), (r + dr, c + dc), (r + 2*dr, c + 2*dc))
+          for (dr, dc) in DIRECTIONS if (r + 2*dr, c + 2*dc) in SQUARE_BIT)
+    for (r, c) in PLAYABLE_SQUARES
+)
+
+# Starting position: 3 rows of black on top, 3 rows of white on bottom
+START_BLACK_MEN = sum(1 << sq for sq, (r, c) in enumerate(PLAYABLE_SQUARES) if r < 3)
+START_WHITE_MEN = sum(1 << sq for sq, (r, c) in enumerate(PLAYABLE_SQUARES) if r > 4)
+
+
+def _JumpSequences(sq: int, empty: int, opp: int, captures: list, sequence: list,
+                   start: Tuple[int, int], out: list):
+    """
+    Depth-first search for multi-jumps from square sq, appending each finished
+    sequence to out as a move dict.
+
+    Args:
+        sq: Square the jumping piece currently stands on
+        empty: Bitboard of empty squares (the start and captured squares are cleared as the piece jumps)
+        opp: Bitboard of opponent pieces not yet captured
+        captures: Captured (r, c) positions so far
+        sequence: Landing (r, c) squares so far
+        start: (r, c) the piece started from
+        out: List receiving finished capture moves
+    """
+    found_any = False
+    sq_bit = 1 << sq
+    for mid_bit, land_bit, land_sq, mid_rc, land_rc in JUMPS[sq]:
+        if opp & mid_bit and empty & land_bit:
+            found_any = True
+            _JumpSequences(land_sq, (empty | sq_bit | mid_bit) & ~land_bit, opp & ~mid_bit,
+                           captures + [mid_rc], sequence + [land_rc], start, out)
+    if not found_any and captures:
+        # terminal capture sequence
+        out.append({'start': start, 'sequence': sequence, 'captures': captures})
+
+
+def _CountJumpSequences(sq: int, empty: int, opp: int) -> int:
+    """
+    Count the finished multi-jump sequences _JumpSequences would produce from
+    square sq, without building them. Only valid once the piece has captured
+    or is known to have a jump.
+
+    Args:
+        sq: Square the jumping piece currently stands on
+        empty: Bitboard of empty squares
+        opp: Bitboard of opponent pieces not yet captured
+
+    Returns:
+        int: Number of capture sequences
+    """
+    total = 0
+    sq_bit = 1 << sq
+    for mid_bit, land_bit, land_sq, _, _ in JUMPS[sq]:
+        if opp & mid_bit and empty & land_bit:
+            total += _CountJumpSequences(land_sq, (empty | sq_bit | mid_bit) & ~land_bit, opp & ~mid_bit)
+    return total or 1
+
+
+def _CountMoves(own: int, kings: int, opp: int, white: bool) -> int:
+    """
+    Count the legal moves of the side owning own (its kings in kings) against opp.
+
+    Args:
+        own: Bitboard of the side's pieces
+        kings: Bitboard of the side's kings
+        opp: Bitboard of the opponent's pieces
+        white: True if the side is white (men move towards row 0)
+
+    Returns:
+        int: Number of legal moves
+    """
+    empty = ~(own | opp) & ALL_SQUARES
+    jumpers = _Jumpers(own, opp, empty)
+    if jumpers:
+        captures = 0
+        while jumpers:
+            low = jumpers & -jumpers
+            jumpers ^= low
+            captures += _CountJumpSequences(low.bit_length() - 1, empty, opp)
+        return captures
+
+    up, down = (own, kings) if white else (kings, own)
+    # Each shifted set holds one target per movable piece in that direction
+    return (bin((((up & EVEN_ROWS) >> 4) | ((up & ODD_ROWS_NOT_LEFT) >> 5)) & empty).count('1')
+            + bin((((up & EVEN_ROWS_NOT_RIGHT) >> 3) | ((up & ODD_ROWS) >> 4)) & empty).count('1')
+            + bin((((down & EVEN_ROWS) << 4) | ((down & ODD_ROWS_NOT_LEFT) << 3)) & empty).count('1')
+            + bin((((down & EVEN_ROWS_NOT_RIGHT) << 5) | ((down & ODD_ROWS) << 4)) & empty).count('1'))
+
+
+def _PiecePoints(men: int, kings: int) -> int:
+    """Material plus center bonus of one side, in EVAL_UNITs."""
+    pieces = men | kings
+    # The planes hold CENTER_POINTS + 1; the -1 per piece is folded into the material weights
+    return ((MAN_POINTS - 1) * bin(men).count('1') + (KING_POINTS - 1) * bin(kings).count('1')
+            + bin(pieces & CENTER_PLANES[0]).count('1')
+            + 2 * bin(pieces & CENTER_PLANES[1]).count('1')
+            + 4 * bin(pieces & CENTER_PLANES[2]).count('1'))
+
+
+def EvaluateBitboards(white_men: int, white_kings: int, black_men: int, black_kings: int,
+                      player: str, to_move: Optional[str] = None) -> float:
+    """
+    GameBoard.EvaluateFor on raw bitboards, so a search can score a successor
+    position without building or mutating a GameBoard.
+
+    Args:
+        white_men: Bitboard of white men
+        white_kings: Bitboard of white kings
+        black_men: Bitboard of black men
+        black_kings: Bitboard of black kings
+        player: Player to evaluate for ('w' or 'b')
+        to_move: Optional side to move; if given and it has no legal moves,
+            the position is scored as lost for it (+/-inf), like GoalTest
+
+    Returns:
+        float: Evaluation score (higher is better for player)
+    """
+    white = white_men | white_kings
+    black = black_men | black_kings
+    white_moves = _CountMoves(white, white_kings, black, True)
+    black_moves = _CountMoves(black, black_kings, white, False)
+    if to_move is not None and not (white_moves if to_move == 'w' else black_moves):
+        return float('-inf') if to_move == player else float('inf')
+    points = (_PiecePoints(white_men, white_kings) - _PiecePoints(black_men, black_kings)
+              + MOBILITY_POINTS * (white_moves - black_moves))
+    return (points if player == 'w' else -points) * EVAL_UNIT
+
+
+def CaptureAvailable(white_men: int, white_kings: int, black_men: int, black_kings: int,
+                     player: str) -> bool:
+    """
+    GameBoard.HasCapture on raw bitboards.
+
+    Args:
+        white_men: Bitboard of white men
+        white_kings: Bitboard of white kings
+        black_men: Bitboard of black men
+        black_kings: Bitboard of black kings
+        player: Player to check ('w' or 'b')
+
+    Returns:
+        bool: True if player has at least one capture
+    """
+    white = white_men | white_kings
+    black = black_men | black_kings
+    empty = ~(white | black) & ALL_SQUARES
+    if player == 'w':
+        return _Jumpers(white, black, empty) != 0
+    return _Jumpers(black, white, empty) != 0
+
 
 class GameBoard:
     """
     Represents the checkers board and game state.
-    
+
     Attributes:
         BOARD_SIZE: Size of the board (8x8)
-        Board: 2D list representing the game board
+        WhiteMen: Bitboard of white men
+        WhiteKings: Bitboard of white kings
+        BlackMen: Bitboard of black men
+        BlackKings: Bitboard of black kings
+        Board: 2D list view of the game board (built from the bitboards)
         PlayerToMove: Current player's turn ('w' or 'b')
+        Hash: Zobrist hash of the position, kept up to date by ApplyMove/MakeMove
     """
 
     BOARD_SIZE = 8
@@ -39,53 +303,98 @@ class GameBoard:
                  player_to_move: str = 'w'):
         """
         Initialize a GameBoard. If board is None, create the standard starting position.
-        
+
         Args:
             board: Optional 2D list representing board state
             player_to_move: 'w' (white/human) or 'b' (black/agent). Defaults to 'w'.
         """
+        self.PlayerToMove = player_to_move  # 'w' or 'b'
         if board is None:
-            self.Board = self._CreateStartingBoard()
+            self.WhiteMen, self.WhiteKings = START_WHITE_MEN, 0
+            self.BlackMen, self.BlackKings = START_BLACK_MEN, 0
+            self.Hash = ZobristHash(START_WHITE_MEN, 0, START_BLACK_MEN, 0, player_to_move)
         else:
             self.Board = board
-        self.PlayerToMove = player_to_move  # 'w' or 'b'
 
-    def _CreateStartingBoard(self) -> List[List[Optional[str]]]:
+    @classmethod
+    def _FromBitboards(cls, white_men: int, white_kings: int, black_men: int, black_kings: int,
+                       player_to_move: str, zobrist_hash: int) -> 'GameBoard':
+        """Build a GameBoard directly from bitboards and their hash, skipping __init__."""
+        nb = cls.__new__(cls)
+        nb.WhiteMen = white_men
+        nb.WhiteKings = white_kings
+        nb.BlackMen = black_men
+        nb.BlackKings = black_kings
+        nb.PlayerToMove = player_to_move
+        nb.Hash = zobrist_hash
+        return nb
+
+    @property
+    def Board(self) -> List[List[Optional[str]]]:
         """
-        Create the standard checkers starting position: 3 rows of black on top, 3 rows of white on bottom.
-        Playable squares are those with (r+c)%2==1.
-          Returns:
-            List[List[Optional[str]]]: Initial board configuration
+        8x8 grid view of the position with items None, 'w', 'W', 'b', 'B'.
+        A fresh list is built on each access; edits to it do not change the board.
+
+        Returns:
+            List[List[Optional[str]]]: Board grid
         """
-        B = [[None for _ in range(self.BOARD_SIZE)] for __ in range(self.BOARD_SIZE)]
+        grid = [[None] * self.BOARD_SIZE for _ in range(self.BOARD_SIZE)]
+        for symbol, bb in (('w', self.WhiteMen), ('W', self.WhiteKings),
+                           ('b', self.BlackMen), ('B', self.BlackKings)):
+            while bb:
+                low = bb & -bb
+                r, c = PLAYABLE_SQUARES[low.bit_length() - 1]
+                grid[r][c] = symbol
+                bb ^= low
+        return grid
+
+    @Board.setter
+    def Board(self, board: List[List[Optional[str]]]):
+        """Load the position from an 8x8 grid (pieces must stand on playable squares) for the current player to move."""
+        bitboards = {'w': 0, 'W': 0, 'b': 0, 'B': 0}
         for r in range(self.BOARD_SIZE):
             for c in range(self.BOARD_SIZE):
-                if (r + c) % 2 == 1:
-                    if r < 3:
-                        B[r][c] = 'b'  # black starts top
-                    elif r > 4:
-                        B[r][c] = 'w'  # white bottom
-        return B
+                piece = board[r][c]
+                if piece is not None:
+                    bitboards[piece] |= SQUARE_BIT[(r, c)]
+        self.WhiteMen, self.WhiteKings = bitboards['w'], bitboards['W']
+        self.BlackMen, self.BlackKings = bitboards['b'], bitboards['B']
+        self.Hash = ZobristHash(self.WhiteMen, self.WhiteKings, self.BlackMen, self.BlackKings,
+                                self.PlayerToMove)
 
     def Clone(self) -> 'GameBoard':
         """
-        Return a deep copy of the board state.
-        
+        Return a copy of the board state. The state is four ints and the side to
+        move, so copying is constant-time.
+
         Returns:
-            GameBoard: Deep copy of current board state
+            GameBoard: Copy of current board state
+        """
+        return GameBoard._FromBitboards(self.WhiteMen, self.WhiteKings, self.BlackMen,
+                                        self.BlackKings, self.PlayerToMove, self.Hash)
+
+    def Key(self) -> Tuple[int, int, int, int, str]:
         """
-        return GameBoard(board=copy.deepcopy(self.Board), player_to_move=self.PlayerToMove)
+        Return a compact hashable key for this position: the four bitboards and
+        the player to move. Equal positions give equal keys, so the key can
+        index caches such as a transposition table.
+
+        Returns:
+            Tuple[int, int, int, int, str]: Position key
+        """
+        return (self.WhiteMen, self.WhiteKings, self.BlackMen, self.BlackKings, self.PlayerToMove)
 
     def DisplayBoard(self):
         """
         Nicely prints the board to stdout. Shows row/column indices 0..7.
         """
+        board = self.Board
         print("    " + " ".join(str(c) for c in range(self.BOARD_SIZE)))
         print("   +" + "--" * self.BOARD_SIZE + "+")
         for r in range(self.BOARD_SIZE):
             rowstr = f"{r} | "
             for c in range(self.BOARD_SIZE):
-                cell = self.Board[r][c]
+                cell = board[r][c]
                 rowstr += (cell if cell is not None else '.') + " "
             rowstr += "|"
             print(rowstr)
@@ -94,74 +403,40 @@ class GameBoard:
     def GetPiecesOfPlayer(self, player: str) -> List[Tuple[int, int]]:
         """
         Returns list of (r,c) positions occupied by player's pieces (both kings and men).
-        
+
         Args:
             player: 'w' or 'b'
-            
+
         Returns:
             List[Tuple[int, int]]: List of positions containing player's pieces
         """
+        if player == 'w':
+            bb = self.WhiteMen | self.WhiteKings
+        else:
+            bb = self.BlackMen | self.BlackKings
         result = []
-        for r in range(self.BOARD_SIZE):
-            for c in range(self.BOARD_SIZE):
-                piece = self.Board[r][c]
-                if piece is None:
-                    continue
-                if piece.lower() == player:
-                    result.append((r, c))
+        while bb:
+            low = bb & -bb
+            result.append(PLAYABLE_SQUARES[low.bit_length() - 1])
+            bb ^= low
         return result
 
     def GoalTest(self) -> Optional[str]:
         """
-        Returns the winner 'w' or 'b' if one has no pieces left, otherwise None.
-        
+        Returns the winner 'w' or 'b' if one has no pieces left, or if the
+        player to move has no legal move (and so loses), otherwise None.
+
         Returns:
             Optional[str]: Winner ('w' or 'b') or None if game continues
         """
-        w_pieces = any(self.Board[r][c] is not None and self.Board[r][c].lower() == 'w'
-                       for r in range(self.BOARD_SIZE) for c in range(self.BOARD_SIZE))
-        b_pieces = any(self.Board[r][c] is not None and self.Board[r][c].lower() == 'b'
-                       for r in range(self.BOARD_SIZE) for c in range(self.BOARD_SIZE))
-        if not w_pieces:
+        if not (self.WhiteMen | self.WhiteKings):
             return 'b'
-        if not b_pieces:
+        if not (self.BlackMen | self.BlackKings):
             return 'w'
+        if not self.CountLegalMoves(self.PlayerToMove):
+            return OtherStuff.OpponentOf(self.PlayerToMove)
         return None
 
-    # -------------------------
-    # Move generation helpers
-    # -------------------------
-    def _InBounds(self, r: int, c: int) -> bool:
-        """Check if position is within board boundaries."""
-        return 0 <= r < self.BOARD_SIZE and 0 <= c < self.BOARD_SIZE
-
-    def _IsOpponentPiece(self, piece: str, player: str) -> bool:
-        """Check if piece belongs to opponent."""
-        return piece is not None and piece.lower() != player
-
-    def _PieceDirections(self, piece: str) -> List[Tuple[int, int]]:
-        """
-        Returns movement directions for piece:
-        - Men: 'w' moves up (r-1), 'b' moves down (r+1)
-        - Kings: can move both up/down
-        Directions are diagonal offsets (dr, dc)
-        
-        Args:
-            piece: Piece symbol ('w', 'W', 'b', 'B', or None)
-            
-        Returns:
-            List[Tuple[int, int]]: List of valid direction tuples
-        """
-        if piece is None:
-            return []
-        if piece.isupper():  # King
-            return [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        else:
-            if piece == 'w':
-                return [(-1, -1), (-1, 1)]
-            else:  # 'b'
-                return [(1, -1), (1, 1)]
-
     def GenerateLegalMoves(self, player: str) -> List[dict]:
         """
         Generate all legal moves for the given player.
@@ -171,112 +446,177 @@ class GameBoard:
           - 'captures': list of captured positions
         Captures are mandatory: if any capture move exists, only those are returned.
         For simple moves, 'captures' is empty and 'sequence' has exactly one target.
-        
+        Pieces are visited in row-major order and directions in DIRECTIONS order.
+
         Args:
             player: Player symbol ('w' or 'b')
-            
+
         Returns:
             List[dict]: List of legal move dictionaries
         """
-        all_moves = []
-        capture_moves = []
-
-        for (r, c) in self.GetPiecesOfPlayer(player):
-            piece = self.Board[r][c]
-            # first find captures (multi-jump allowed)
-            visited = set()
-            def dfs_jumps(cur_r, cur_c, captured_so_far, seq):
-                """
-                Recursively find multi-jumps from position (cur_r,cur_c).
-                captured_so_far: list of captured positions
-                seq: sequence of landing squares from the original start (list)
-                """
-                found_any = False
-                dirs = self._PieceDirections(piece if len(captured_so_far)==0 else self.Board[orig_r][orig_c])
-                # Note: During multi-jump the piece may become a king only after turn end (not in mid jump) in American checkers.
-                for (dr, dc) in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                    mid_r = cur_r + dr
-                    mid_c = cur_c + dc
-                    land_r = cur_r + 2*dr
-                    land_c = cur_c + 2*dc
-                    if not (self._InBounds(mid_r, mid_c) and self._InBounds(land_r, land_c)):
-                        continue
-                    mid_piece = self.Board[mid_r][mid_c]
-                    land_piece = self.Board[land_r][land_c]
-                    if mid_piece is None or land_piece is not None:
-                        continue
-                    if (mid_r, mid_c) in captured_so_far:
-                        continue
-                    if self._IsOpponentPiece(mid_piece, player):
-                        # Make a temporary board change to allow further jumps without modifying self.
-                        found_any = True
-                        new_captured = captured_so_far + [(mid_r, mid_c)]
-                        new_seq = seq + [(land_r, land_c)]
-                        # save original pieces
-                        orig_mid = self.Board[mid_r][mid_c]
-                        orig_land = self.Board[land_r][land_c]
-                        orig_cur = self.Board[cur_r][cur_c]
-                        self.Board[land_r][land_c] = self.Board[cur_r][cur_c]
-                        self.Board[cur_r][cur_c] = None
-                        self.Board[mid_r][mid_c] = None
-                        dfs_jumps(land_r, land_c, new_captured, new_seq)
-                        # restore
-                        self.Board[cur_r][cur_c] = orig_cur
-                        self.Board[mid_r][mid_c] = orig_mid
-                        self.Board[land_r][land_c] = orig_land
-                if not found_any and captured_so_far:
-                    # terminal capture sequence
-                    capture_moves.append({'start': (orig_r, orig_c),
-                                          'sequence': seq.copy(),
-                                          'captures': captured_so_far.copy()})
-            orig_r, orig_c = r, c
-            dfs_jumps(r, c, [], [])
-            # If no captures from this piece, consider simple moves
-            if not any(move['start'] == (r, c) for move in capture_moves):
-                for (dr, dc) in self._PieceDirections(piece):
-                    nr = r + dr
-                    nc = c + dc
-                    if self._InBounds(nr, nc) and self.Board[nr][nc] is None:
-                        all_moves.append({'start': (r, c), 'sequence': [(nr, nc)], 'captures': []})
-
-        # If any capture moves anywhere, only return captures
-        if capture_moves:
+        if player == 'w':
+            men, kings = self.WhiteMen, self.WhiteKings
+            opp = self.BlackMen | self.BlackKings
+            man_steps = WHITE_MAN_STEPS
+        else:
+            men, kings = self.BlackMen, self.BlackKings
+            opp = self.WhiteMen | self.WhiteKings
+            man_steps = BLACK_MAN_STEPS
+        own = men | kings
+        empty = ~(own | opp) & ALL_SQUARES
+
+        # Captures first (multi-jump allowed); any piece may jump in all four directions.
+        # Only the pieces in the jumper mask are searched, and none when nothing can jump.
+        jumpers = _Jumpers(own, opp, empty)
+        if jumpers:
+            capture_moves = []
+            while jumpers:
+                low = jumpers & -jumpers
+                sq = low.bit_length() - 1
+                jumpers ^= low
+                _JumpSequences(sq, empty, opp, [], [], PLAYABLE_SQUARES[sq], capture_moves)
             return capture_moves
+
+        # No captures anywhere: simple moves
+        all_moves = []
+        bb = own
+        while bb:
+            low = bb & -bb
+            sq = low.bit_length() - 1
+            bb ^= low
+            start = PLAYABLE_SQUARES[sq]
+            for target_bit, target in (KING_STEPS[sq] if kings & low else man_steps[sq]):
+                if empty & target_bit:
+                    all_moves.append({'start': start, 'sequence': [target], 'captures': []})
         return all_moves
 
+    def SuccessorBitboards(self, move: dict) -> Tuple[int, int, int, int]:
+        """
+        Compute the four bitboards that result from playing move, handling
+        captures and kinging (when a man reaches last rank).
+
+        Args:
+            move: Dictionary containing move information
+
+        Returns:
+            Tuple[int, int, int, int]: (WhiteMen, WhiteKings, BlackMen, BlackKings) after the move
+        """
+        start_bit = SQUARE_BIT[move['start']]
+        # For sequence, land on final square (intermediate landing squares used only for multiple jumps)
+        last_bit = SQUARE_BIT[move['sequence'][-1]] if move['sequence'] else start_bit
+        captured = 0
+        for position in move['captures']:
+            captured |= SQUARE_BIT[position]
+        # Lift the piece and clear captures; a piece landing on a captured square is removed,
+        # but a man reaching the last rank is still crowned there
+        keep = ~(start_bit | last_bit | captured)
+        wm, wk = self.WhiteMen & keep, self.WhiteKings & keep
+        bm, bk = self.BlackMen & keep, self.BlackKings & keep
+        placed = last_bit & ~captured
+        if self.WhiteMen & start_bit:
+            if last_bit & WHITE_KING_ROW:
+                wk |= last_bit  # kinging
+            else:
+                wm |= placed
+        elif self.WhiteKings & start_bit:
+            wk |= placed
+        elif self.BlackMen & start_bit:
+            if last_bit & BLACK_KING_ROW:
+                bk |= last_bit  # kinging
+            else:
+                bm |= placed
+        elif self.BlackKings & start_bit:
+            bk |= placed
+        return wm, wk, bm, bk
+
+    def _HashAfter(self, wm: int, wk: int, bm: int, bk: int) -> int:
+        """Return Hash updated for a move to the given bitboards (only changed squares are XORed)."""
+        h = self.Hash ^ ZOBRIST_BLACK_TO_MOVE
+        for table, changed in zip(ZOBRIST_PIECE, (self.WhiteMen ^ wm, self.WhiteKings ^ wk,
+                                                  self.BlackMen ^ bm, self.BlackKings ^ bk)):
+            while changed:
+                low = changed & -changed
+                h ^= table[low.bit_length() - 1]
+                changed ^= low
+        return h
+
+    def CountLegalMoves(self, player: str) -> int:
+        """
+        Number of moves GenerateLegalMoves(player) would return, computed with
+        whole-board shifts (or a counting jump search) so no move dicts are built.
+
+        Args:
+            player: Player symbol ('w' or 'b')
+
+        Returns:
+            int: Number of legal moves
+        """
+        if player == 'w':
+            return _CountMoves(self.WhiteMen | self.WhiteKings, self.WhiteKings,
+                               self.BlackMen | self.BlackKings, True)
+        return _CountMoves(self.BlackMen | self.BlackKings, self.BlackKings,
+                           self.WhiteMen | self.WhiteKings, False)
+
+    def HasCapture(self, player: str) -> bool:
+        """
+        True if player has a capture, i.e. GenerateLegalMoves(player) would
+        return only capture moves. Found with whole-board shifts.
+
+        Args:
+            player: Player symbol ('w' or 'b')
+
+        Returns:
+            bool: True if at least one capture is available
+        """
+        return CaptureAvailable(self.WhiteMen, self.WhiteKings, self.BlackMen, self.BlackKings,
+                                player)
+
     def ApplyMove(self, move: dict) -> 'GameBoard':
         """
         Apply a move dict to this board and return a new GameBoard as successor.
         move keys: 'start', 'sequence' (list of landing squares), 'captures' (list of captured positions)
         After move, switch player.
         Handle kinging (when a man reaches last rank).
-        
+
         Args:
             move: Dictionary containing move information
-            
+
         Returns:
             GameBoard: New board state after applying move
         """
-        nb = self.Clone()
-        sr, sc = move['start']
-        piece = nb.Board[sr][sc]
-        nb.Board[sr][sc] = None
-        # For sequence, land on final square (intermediate landing squares used only for multiple jumps)
-        last_r, last_c = (sr, sc)
-        for (tr, tc) in move['sequence']:
-            last_r, last_c = tr, tc
-        # place piece
-        nb.Board[last_r][last_c] = piece
-        # remove captures
-        for (cr, cc) in move['captures']:
-            nb.Board[cr][cc] = None
-        # kinging
-        if piece == 'w' and last_r == 0:
-            nb.Board[last_r][last_c] = 'W'
-        if piece == 'b' and last_r == self.BOARD_SIZE - 1:
-            nb.Board[last_r][last_c] = 'B'
-        nb.PlayerToMove = OtherStuff.OpponentOf(self.PlayerToMove)
-        return nb
+        wm, wk, bm, bk = self.SuccessorBitboards(move)
+        return GameBoard._FromBitboards(wm, wk, bm, bk, OtherStuff.OpponentOf(self.PlayerToMove),
+                                        self._HashAfter(wm, wk, bm, bk))
+
+    def MakeMove(self, move: dict) -> Tuple[int, int, int, int, str, int]:
+        """
+        Play move on this board in place (same rules as ApplyMove) and return an
+        undo record for UnmakeMove. Lets a search walk the tree on one board
+        instead of allocating a successor per node.
+
+        Args:
+            move: Dictionary containing move information
+
+        Returns:
+            Tuple[int, int, int, int, str, int]: Undo record (the state before the move)
+        """
+        undo = (self.WhiteMen, self.WhiteKings, self.BlackMen, self.BlackKings, self.PlayerToMove,
+                self.Hash)
+        wm, wk, bm, bk = self.SuccessorBitboards(move)
+        self.Hash = self._HashAfter(wm, wk, bm, bk)
+        self.WhiteMen, self.WhiteKings, self.BlackMen, self.BlackKings = wm, wk, bm, bk
+        self.PlayerToMove = OtherStuff.OpponentOf(self.PlayerToMove)
+        return undo
+
+    def UnmakeMove(self, undo: Tuple[int, int, int, int, str, int]):
+        """
+        Take back the move that produced undo, restoring the previous state.
+
+        Args:
+            undo: Record returned by MakeMove
+        """
+        (self.WhiteMen, self.WhiteKings, self.BlackMen, self.BlackKings, self.PlayerToMove,
+         self.Hash) = undo
 
     def MakeMoveIfLegal(self, StartingMoveLocation: Tuple[int,int], TargetingMoveLocation: Tuple[int,int]) -> Optional['GameBoard']:
         """
@@ -317,6 +657,8 @@ class GameBoard:
          - piece count: men = 1, kings = 1.8
          - mobility: number of legal moves * 0.1
          - center control bonus
+        A position where PlayerToMove has no legal moves (or no pieces) is lost
+        for that side and scores +/-inf, as GoalTest reports and the search scores it.
          
         Args:
             player: Player to evaluate for ('w' or 'b')
@@ -324,23 +666,5 @@ class GameBoard:
         Returns:
             float: Evaluation score (higher is better for player)
         """
-        my_score = 0.0
-        opp_score = 0.0
-        for r in range(self.BOARD_SIZE):
-            for c in range(self.BOARD_SIZE):
-                p = self.Board[r][c]
-                if p is None:
-                    continue
-                val = 1.0 if p.islower() else 1.8  # king slightly more valuable
-                # center control
-                center_bonus = 0.05 * (3 - (abs(3.5 - r) + abs(3.5 - c))/2.0)
-                val += center_bonus
-                if p.lower() == player:
-                    my_score += val
-                else:
-                    opp_score += val
-        # mobility
-        my_moves = len(self.GenerateLegalMoves(player))
-        opp_moves = len(self.GenerateLegalMoves(OtherStuff.OpponentOf(player)))
-        mobility_score = 0.1 * (my_moves - opp_moves)
-        return (my_score - opp_score) + mobility_score
+        return EvaluateBitboards(self.WhiteMen, self.WhiteKings, self.BlackMen, self.BlackKings,
+                                 player, to_move=self.PlayerToMove)
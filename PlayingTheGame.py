@@ -39,6 +39,8 @@ class PlayingTheGame:
         """
         self.BoardState = GameBoard()   # human (white) starts
         self.SearchAgent = SearchToolBox(Strategy=Strategy, TimeLimit=TimeLimit, MaxPly=MaxPly)
+        # The console game prints the shallow ordering-gain estimate after each agent move
+        self.SearchAgent.ReportOrderingGain = True
         # cumulative analytics tracked per player
         self.CumulativeAnalytics = {
             'w': {'NodesExpanded': 0, 'NodesGenerated': 0, 'AlphaBetaPrunes': 0, 'Moves': 0},
@@ -4,22 +4,31 @@ SearchToolBox Module
 Implements the search strategies for the Checkers AI agent:
  - Minimax
  - Alpha-Beta pruning
- - Alpha-Beta with node ordering (heuristic ordering)
+ - Alpha-Beta with node ordering (heuristic ordering: evaluation at the root;
+   transposition-table move, captures, killer and history moves below it)
 
-Also enforces time limit T and depth limit P.
+Also enforces time limit T and depth limit P. At depth P a position where a
+capture is pending is not evaluated; captures are searched until it is quiet
+(quiescence search).
 
 Tracks analytics:
  - NodesExpanded: number of nodes visited/expanded
  - NodesGenerated: number of moves generated
  - AlphaBetaPrunes: count of cutoff occurrences
  - OrderingUsed: boolean indicating if ordering was used
- - OrderingEffectPrunesEstimate: estimated gain from ordering
+ - OrderingGainEstimate: estimated gain from ordering (only if ReportOrderingGain is set)
+ - TranspositionHits: nodes answered from the transposition table
 """
 
 import time
 import math
 from typing import Tuple, Optional
-from GameBoard.board import GameBoard
+from GameBoard.board import GameBoard, SQUARE_BIT, EvaluateBitboards, CaptureAvailable
+from OtherStuff import OtherStuff
+
+# Module constants, so the hot loops below need no attribute lookup or negation per node
+_INF = math.inf
+_NEG_INF = -math.inf
 
 
 class SearchToolBox:
@@ -30,14 +39,38 @@ class SearchToolBox:
         Strategy: Search strategy name ("Minimax", "AlphaBeta", "AlphaBetaOrdering")
         TimeLimit: Maximum time allowed per move in seconds
         MaxPly: Maximum depth to search in plies
+        DepthLimit: Depth of the pass in progress (below MaxPly during iterative deepening)
+        DepthReached: Deepest search depth completed for the last move
         NodesExpanded: Counter for nodes expanded
         NodesGenerated: Counter for nodes generated
         AlphaBetaPrunes: Counter for alpha-beta cutoffs
         OrderingUsed: Boolean flag for node ordering
-        TimeStart: Starting time of search
+        ReportOrderingGain: Whether ChooseMove adds the OrderingGainEstimate analytic, which
+            costs two extra shallow searches per move (off by default)
+        TimeStart: Starting time of search (time.perf_counter)
+        Deadline: TimeStart + TimeLimit
         TimeUp: Flag indicating if time limit exceeded
+        Cancel: Optional threading.Event that aborts the current search when set
+        EvalCache: Heuristic values keyed by (position key, player), kept across moves
+        TransTable: Alpha-beta results keyed by Zobrist hash, as (depth, value, flag, best_move),
+            with value for the player to move, so entries stay valid across moves
+        UseTransTable: Whether alpha-beta nodes probe and fill TransTable (on for
+            AlphaBetaOrdering only, so plain AlphaBeta stays the unenhanced baseline)
+        UseQuiescence: Whether depth-limit positions with a pending capture are searched on
+        TranspositionHits: Counter for nodes answered from TransTable
+        Killers: Per ply, the two most recent quiet moves that caused a cutoff
+        History: Cutoff score per (start, landing) of quiet moves
     """
 
+    EVAL_CACHE_LIMIT = 200000
+    TRANS_TABLE_LIMIT = 500000
+    # Transposition entry flags: the stored value is exact, a lower bound or an upper bound
+    TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+    # Half-width of the root search window around the previous iteration's value (half a man)
+    ASPIRATION_WINDOW = 0.5
+    # Nodes searched between looks at the clock and the cancel flag (about 10 ms)
+    TIME_CHECK_INTERVAL = 1024
+
     def __init__(self, Strategy: str = "AlphaBetaOrdering", TimeLimit: float = 2.0, MaxPly: int = 6):
         """
         Initialize the search toolbox with specified parameters.
@@ -50,29 +83,98 @@ class SearchToolBox:
         self.Strategy = Strategy
         self.TimeLimit = TimeLimit
         self.MaxPly = MaxPly
+        self.DepthLimit = MaxPly
+        self.DepthReached = 0
         # analytics counters (reset per move)
         self.NodesExpanded = 0
         self.NodesGenerated = 0
         self.AlphaBetaPrunes = 0
         self.OrderingUsed = (Strategy == "AlphaBetaOrdering")
+        self.ReportOrderingGain = False
         self.TimeStart = None
+        self.Deadline = None
+        self._NodesUntilTimeCheck = 0
         self.TimeUp = False
+        self.Cancel = None
+        self.EvalCache = {}
+        self.TransTable = {}
+        self.UseTransTable = (Strategy == "AlphaBetaOrdering")
+        self.UseQuiescence = True
+        self.TranspositionHits = 0
+        self.Killers = []
+        self.History = {}
+
+    def _StartClock(self):
+        """Start timing a search against TimeLimit."""
+        self.TimeStart = time.perf_counter()
+        self.Deadline = self.TimeStart + self.TimeLimit
+        self._NodesUntilTimeCheck = self.TIME_CHECK_INTERVAL
 
     def _TimeRemaining(self) -> bool:
         """
-        Check if there is time remaining within the time limit.
+        Check if there is time remaining within the time limit and the
+        search has not been cancelled. Called at every node, but only reads
+        the clock and the cancel flag every TIME_CHECK_INTERVAL calls; once
+        they say stop, every later call checks again.
         
         Returns:
             bool: True if time remaining, False otherwise
         """
-        return (time.time() - self.TimeStart) < self.TimeLimit
+        if self._NodesUntilTimeCheck > 1:
+            self._NodesUntilTimeCheck -= 1
+            return True
+        if self.Cancel is not None and self.Cancel.is_set():
+            return False
+        if time.perf_counter() >= self.Deadline:
+            return False
+        self._NodesUntilTimeCheck = self.TIME_CHECK_INTERVAL
+        return True
+
+    def _Evaluate(self, board: GameBoard, player: str) -> float:
+        """
+        Memoized board.EvaluateFor(player). The same position is often evaluated
+        both while ordering a node's children and again as a leaf, and
+        transpositions reach it through different move orders.
+        
+        Args:
+            board: Board to evaluate
+            player: Player to evaluate for
+            
+        Returns:
+            float: Evaluation score (higher is better for player)
+        """
+        return self._EvaluateKey(board.Key(), player)
 
-    def ChooseMove(self, board: GameBoard) -> Tuple[dict, dict]:
+    def _EvaluateKey(self, key: tuple, player: str) -> float:
+        """
+        Memoized evaluation of the position with the given GameBoard.Key(). A
+        position whose side to move has no legal moves is scored as a loss for
+        that side (+/-inf), as GoalTest would report.
+        
+        Args:
+            key: Position key (four bitboards and player to move)
+            player: Player to evaluate for
+            
+        Returns:
+            float: Evaluation score (higher is better for player)
+        """
+        cache_key = (key, player)
+        value = self.EvalCache.get(cache_key)
+        if value is None:
+            if len(self.EvalCache) >= self.EVAL_CACHE_LIMIT:
+                self.EvalCache.clear()
+            value = EvaluateBitboards(key[0], key[1], key[2], key[3], player, to_move=key[4])
+            self.EvalCache[cache_key] = value
+        return value
+
+    def ChooseMove(self, board: GameBoard, cancel=None) -> Tuple[dict, dict]:
         """
         Given a GameBoard where board.PlayerToMove is the agent's color ('b'), select best move.
         
         Args:
             board: Current game board state
+            cancel: Optional threading.Event; once set the search stops at the
+                next node and returns the best move found so far
             
         Returns:
             Tuple[dict, dict]: (chosen_move, analytics_dict)
@@ -82,16 +184,25 @@ class SearchToolBox:
         self.NodesExpanded = 0
         self.NodesGenerated = 0
         self.AlphaBetaPrunes = 0
-        self.TimeStart = time.time()
+        self.TranspositionHits = 0
+        self.Killers = [[None, None] for _ in range(self.MaxPly + 1)]
+        self.History = {}
         self.TimeUp = False
+        self.Cancel = cancel
+        self._StartClock()
+        self.DepthLimit = self.MaxPly
+        self.DepthReached = 0
 
+        # The search plays moves in place with MakeMove/UnmakeMove; work on a private copy
+        board = board.Clone()
         player = board.PlayerToMove
         legal = board.GenerateLegalMoves(player)
         if not legal:
             return (None, self._CollectAnalytics(0.0))
 
+        # Values are from the point of view of player, so the root always maximizes
         bestMove = None
-        bestVal = -math.inf if player == 'b' else math.inf
+        bestVal = _NEG_INF
 
         # For fairness, we will perform a depth-limited search to MaxPly using the selected strategy.
         # If time runs out we return best found so far.
@@ -100,64 +211,77 @@ class SearchToolBox:
         # Precompute move ordering if ordering is enabled
         child_list = legal.copy()
         if self.OrderingUsed:
-            # Order by shallow evaluation after applying move (heuristic)
-            scored_children = []
-            for mv in child_list:
-                succ = board.ApplyMove(mv)
-                v = succ.EvaluateFor(player)
-                scored_children.append((v, mv))
-            # Sort descending since agent ('b') is maximizing black; but generalize: maximize for current player
-            scored_children.sort(key=lambda x: x[0], reverse=True)
-            child_list = [mv for (_, mv) in scored_children]
+            # Order by shallow evaluation of each successor (heuristic), scored straight
+            # from its bitboards without making the move
+            opponent = OtherStuff.OpponentOf(player)
+            # Values are for the opponent, so ascending order puts our best move first
+            child_list.sort(key=lambda mv: self._EvaluateKey(board.SuccessorBitboards(mv) + (opponent,),
+                                                             opponent))
 
         # Search entry depending on Strategy
         if self.Strategy == "Minimax":
             for mv in child_list:
                 self.NodesGenerated += 1
-                succ = board.ApplyMove(mv)
-                val = self._MinValue(succ, 1, player)
+                undo = board.MakeMove(mv)
+                val = self._MinValue(board, 1, player)
+                board.UnmakeMove(undo)
                 if val is None:
                     break  # time up
-                if val > bestVal:
+                if bestMove is None or val > bestVal:
                     bestVal = val
                     bestMove = mv
+            if not self.TimeUp:
+                self.DepthReached = self.MaxPly
         elif self.Strategy == "AlphaBeta":
-            alpha = -math.inf
-            beta = math.inf
-            for mv in child_list:
-                self.NodesGenerated += 1
-                succ = board.ApplyMove(mv)
-                val = self._AlphaBetaMin(succ, 1, alpha, beta, player, use_ordering=False)
-                if val is None:
-                    break
-                if val > bestVal:
-                    bestVal = val
-                    bestMove = mv
-                alpha = max(alpha, bestVal)
+            bestMove, bestVal = self._AlphaBetaRoot(board, child_list, player, use_ordering=False)
+            if not self.TimeUp:
+                self.DepthReached = self.MaxPly
         elif self.Strategy == "AlphaBetaOrdering":
-            alpha = -math.inf
-            beta = math.inf
-            for mv in child_list:
-                self.NodesGenerated += 1
-                succ = board.ApplyMove(mv)
-                val = self._AlphaBetaMin(succ, 1, alpha, beta, player, use_ordering=True)
-                if val is None:
+            # Iterative deepening: each pass searches one ply deeper and starts with the
+            # previous pass's best move, so when time runs out the last full pass (or a
+            # better move the interrupted pass already proved) is played
+            for limit in range(1, self.MaxPly + 1):
+                self.DepthLimit = limit
+                # Aspiration window: expect about the previous pass's value, and reopen
+                # the side that fails (the value found is then only a bound)
+                alpha, beta = _NEG_INF, _INF
+                if limit > 1 and abs(bestVal) != _INF:
+                    alpha = bestVal - self.ASPIRATION_WINDOW
+                    beta = bestVal + self.ASPIRATION_WINDOW
+                while True:
+                    move, val = self._AlphaBetaRoot(board, child_list, player, True, alpha, beta)
+                    # After a fail low every value is only an upper bound, so keep the old best;
+                    # a fail high beat it and is searched first when the window is reopened
+                    if move is not None and (val > alpha or alpha == _NEG_INF):
+                        bestMove, bestVal = move, val
+                        self._MoveToFront(child_list, bestMove)
+                    if self.TimeUp:
+                        break
+                    if val <= alpha and alpha != _NEG_INF:
+                        alpha = _NEG_INF
+                    elif val >= beta and beta != _INF:
+                        beta = _INF
+                    else:
+                        break
+                if self.TimeUp:
                     break
-                if val > bestVal:
-                    bestVal = val
-                    bestMove = mv
-                alpha = max(alpha, bestVal)
+                self.DepthReached = limit
+            self.DepthLimit = self.MaxPly
         else:
             raise ValueError("Unknown strategy: " + self.Strategy)
 
-        time_used = time.time() - self.TimeStart
+        if bestMove is None:
+            # Out of time before any root move finished: play the first in search order
+            bestMove = child_list[0]
+
+        time_used = time.perf_counter() - self.TimeStart
         analytics = self._CollectAnalytics(time_used)
         # Optionally compute ordering effect estimate at shallow depth to report "ordering gain"
-        if self.OrderingUsed:
-            ordering_gain_est = self._EstimateOrderingGain(board, player)
-            analytics['OrderingGainEstimate'] = ordering_gain_est
-        else:
-            analytics['OrderingGainEstimate'] = 0
+        if self.ReportOrderingGain:
+            if self.OrderingUsed and not (cancel is not None and cancel.is_set()):
+                analytics['OrderingGainEstimate'] = self._EstimateOrderingGain(board, player)
+            else:
+                analytics['OrderingGainEstimate'] = 0
 
         return (bestMove, analytics)
 
@@ -175,9 +299,11 @@ class SearchToolBox:
             'NodesExpanded': self.NodesExpanded,
             'NodesGenerated': self.NodesGenerated,
             'AlphaBetaPrunes': self.AlphaBetaPrunes,
+            'TranspositionHits': self.TranspositionHits,
             'OrderingUsed': self.OrderingUsed,
             'TimeUsed': time_used,
             'MaxPly': self.MaxPly,
+            'DepthReached': self.DepthReached,
             'TimeLimit': self.TimeLimit
         }
 
@@ -200,21 +326,23 @@ class SearchToolBox:
             self.TimeUp = True
             return None
         self.NodesExpanded += 1
-        winner = board.GoalTest()
-        if winner is not None:
-            # Terminal utility: large positive if root_player wins
-            return float('inf') if winner == root_player else float('-inf')
-        if depth >= self.MaxPly:
-            return board.EvaluateFor(root_player)
-        v = math.inf
+        # Past the depth limit only forced captures are searched (quiescence)
+        if depth >= self.DepthLimit and not (self.UseQuiescence
+                                             and board.HasCapture(board.PlayerToMove)):
+            return self._Evaluate(board, root_player)
+        # A side with no legal moves (or no pieces) has lost: with no moves v stays +inf
+        v = _INF
         moves = board.GenerateLegalMoves(board.PlayerToMove)
         self.NodesGenerated += len(moves)
+        make, unmake, child_value = board.MakeMove, board.UnmakeMove, self._MaxValue
         for mv in moves:
-            succ = board.ApplyMove(mv)
-            val = self._MaxValue(succ, depth + 1, root_player)
+            undo = make(mv)
+            val = child_value(board, depth + 1, root_player)
+            unmake(undo)
             if val is None:
                 return None
-            v = min(v, val)
+            if val < v:
+                v = val
         return v
 
     def _MaxValue(self, board: GameBoard, depth: int, root_player: str) -> Optional[float]:
@@ -233,119 +361,338 @@ class SearchToolBox:
             self.TimeUp = True
             return None
         self.NodesExpanded += 1
-        winner = board.GoalTest()
-        if winner is not None:
-            return float('inf') if winner == root_player else float('-inf')
-        if depth >= self.MaxPly:
-            return board.EvaluateFor(root_player)
-        v = -math.inf
+        # Past the depth limit only forced captures are searched (quiescence)
+        if depth >= self.DepthLimit and not (self.UseQuiescence
+                                             and board.HasCapture(board.PlayerToMove)):
+            return self._Evaluate(board, root_player)
+        # A side with no legal moves (or no pieces) has lost: with no moves v stays -inf
+        v = _NEG_INF
         moves = board.GenerateLegalMoves(board.PlayerToMove)
         self.NodesGenerated += len(moves)
+        make, unmake, child_value = board.MakeMove, board.UnmakeMove, self._MinValue
         for mv in moves:
-            succ = board.ApplyMove(mv)
-            val = self._MinValue(succ, depth + 1, root_player)
+            undo = make(mv)
+            val = child_value(board, depth + 1, root_player)
+            unmake(undo)
             if val is None:
                 return None
-            v = max(v, val)
+            if val > v:
+                v = val
         return v
 
     # -------------------------
-    # Alpha-Beta helpers
+    # Transposition table
     # -------------------------
-    def _AlphaBetaMax(self, board: GameBoard, depth: int, alpha: float, beta: float,
-                      root_player: str, use_ordering: bool) -> Optional[float]:
+    def _ProbeTransposition(self, board: GameBoard, remaining: int, alpha: float,
+                            beta: float) -> Tuple[Optional[float], float, float, Optional[dict]]:
         """
-        Alpha-beta maximizing node.
+        Look up board in the transposition table.
         
         Args:
             board: Current board state
-            depth: Current search depth
+            remaining: Plies left to search below this node
             alpha: Alpha value for pruning
             beta: Beta value for pruning
-            root_player: Original player at root of search tree
-            use_ordering: Whether to use node ordering
             
         Returns:
-            Optional[float]: Maximum value or None if time limit exceeded
+            Tuple[Optional[float], float, float, Optional[dict]]: (value, alpha, beta, best_move)
+                value is set when the stored result answers this node outright;
+                alpha/beta are tightened by a stored bound that is deep enough;
+                best_move is the stored best move to try first, if any
+        """
+        entry = self.TransTable.get(board.Hash)
+        if entry is None:
+            return None, alpha, beta, None
+        depth, value, flag, best_move = entry
+        if depth >= remaining:
+            if flag == self.TT_EXACT:
+                return value, alpha, beta, best_move
+            if flag == self.TT_LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value, alpha, beta, best_move
+        return None, alpha, beta, best_move
+
+    def _StoreTransposition(self, board: GameBoard, remaining: int, value: float,
+                            alpha: float, beta: float, best_move: Optional[dict]):
+        """
+        Record a searched node, keeping an existing entry that was searched deeper.
+        
+        Args:
+            board: Board state that was searched
+            remaining: Plies that were searched below this node
+            value: Value found
+            alpha: Alpha value the node was entered with
+            beta: Beta value the node was entered with
+            best_move: Move that produced value
+        """
+        old = self.TransTable.get(board.Hash)
+        if old is not None and old[0] > remaining:
+            return
+        if old is None and len(self.TransTable) >= self.TRANS_TABLE_LIMIT:
+            self.TransTable.clear()
+        if value <= alpha:
+            flag = self.TT_UPPER
+        elif value >= beta:
+            flag = self.TT_LOWER
+        else:
+            flag = self.TT_EXACT
+        self.TransTable[board.Hash] = (remaining, value, flag, best_move)
+
+    @staticmethod
+    def _MoveToFront(moves: list, move: Optional[dict]):
+        """Move move (if present) to the front of moves, keeping the rest in order."""
+        if move is None:
+            return
+        for i, mv in enumerate(moves):
+            if mv == move:
+                if i:
+                    moves.insert(0, moves.pop(i))
+                return
+
+    # -------------------------
+    # Move ordering
+    # -------------------------
+    def _OrderMoves(self, board: GameBoard, moves: list, depth: int, tt_move: Optional[dict]):
+        """
+        Sort moves in place, most promising first: the transposition-table move,
+        then captures by number taken (a captured king breaks ties), or for quiet
+        moves the killers of this ply followed by history-heuristic score.
+        Captures are forced, so a move list never mixes the two kinds.
+        
+        Args:
+            board: Board the moves belong to
+            moves: Legal moves to reorder
+            depth: Current search depth (ply index for killer moves)
+            tt_move: Best move stored for this position, if any
+        """
+        if moves and moves[0]['captures']:
+            kings = board.WhiteKings | board.BlackKings
+
+            def score(mv):
+                value = 10 * len(mv['captures'])
+                for position in mv['captures']:
+                    if kings & SQUARE_BIT[position]:
+                        return value + 2
+                return value
+        else:
+            killers = self.Killers[depth]
+            history = self.History
+
+            def score(mv):
+                if mv in killers:
+                    return _INF
+                return history.get((mv['start'], mv['sequence'][-1]), 0)
+        moves.sort(key=score, reverse=True)
+        # the best move found for this position before is the likeliest cutoff
+        self._MoveToFront(moves, tt_move)
+
+    def _RecordCutoff(self, move: dict, depth: int):
+        """
+        Remember a quiet move that caused a beta cutoff: as a killer for this ply
+        and in the history table, weighted by the remaining depth squared.
+        
+        Args:
+            move: Move that caused the cutoff
+            depth: Search depth of the node where it happened
+        """
+        if move['captures']:
+            return
+        killers = self.Killers[depth]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        key = (move['start'], move['sequence'][-1])
+        remaining = self.DepthLimit - depth
+        self.History[key] = self.History.get(key, 0) + remaining * remaining
+
+    # -------------------------
+    # Alpha-Beta helpers
+    # -------------------------
+    def _AlphaBetaRoot(self, board: GameBoard, moves: list, player: str, use_ordering: bool,
+                       alpha: float = _NEG_INF,
+                       beta: float = _INF) -> Tuple[Optional[dict], float]:
+        """
+        Alpha-beta over the root moves, in the given order, to DepthLimit.
+        
+        Args:
+            board: Root board state
+            moves: Root moves in search order
+            player: Player to move at the root
+            use_ordering: Whether to use node ordering below the root
+            alpha: Lower end of the root window
+            beta: Upper end of the root window; the search stops at the first
+                move scoring beta or more
+            
+        Returns:
+            Tuple[Optional[dict], float]: (best_move, best_value) among the moves
+                searched before time ran out; best_move is None if none finished.
+                A best_value at or below alpha (or at or above beta) is only a bound
+        """
+        bestMove = None
+        bestVal = _NEG_INF
+        for mv in moves:
+            self.NodesGenerated += 1
+            undo = board.MakeMove(mv)
+            val = self._Negamax(board, 1, -beta, -alpha, use_ordering)
+            board.UnmakeMove(undo)
+            if val is None:
+                break
+            val = -val
+            if bestMove is None or val > bestVal:
+                bestVal = val
+                bestMove = mv
+            if bestVal >= beta:
+                self.AlphaBetaPrunes += 1
+                break
+            alpha = max(alpha, bestVal)
+        return bestMove, bestVal
+
+    def _LeafValue(self, board: GameBoard, move: dict, alpha: float,
+                   beta: float) -> Optional[float]:
+        """
+        Negamax value of the depth-limit leaf reached by playing move on board.
+        Does the same bookkeeping as entering a node at DepthLimit, but scores the
+        successor's bitboards directly instead of making and unmaking the move,
+        unless a capture is pending there and it needs a quiescence search.
+        
+        Args:
+            board: Board one ply above the depth limit
+            move: Move leading to the leaf
+            alpha: Alpha value for pruning, for the player to move at the leaf
+            beta: Beta value for pruning, for the player to move at the leaf
+            
+        Returns:
+            Optional[float]: Leaf value for the player to move there, or None if
+                time limit exceeded
         """
         if not self._TimeRemaining():
             self.TimeUp = True
             return None
         self.NodesExpanded += 1
-        winner = board.GoalTest()
-        if winner is not None:
-            return float('inf') if winner == root_player else float('-inf')
-        if depth >= self.MaxPly:
-            return board.EvaluateFor(root_player)
-        v = -math.inf
-        moves = board.GenerateLegalMoves(board.PlayerToMove)
+        wm, wk, bm, bk = board.SuccessorBitboards(move)
+        to_move = OtherStuff.OpponentOf(board.PlayerToMove)
+        if self.UseQuiescence and CaptureAvailable(wm, wk, bm, bk, to_move):
+            undo = board.MakeMove(move)
+            val = self._Quiescence(board, alpha, beta)
+            board.UnmakeMove(undo)
+            return val
+        return self._EvaluateKey((wm, wk, bm, bk, to_move), to_move)
+
+    def _Quiescence(self, board: GameBoard, alpha: float, beta: float) -> Optional[float]:
+        """
+        Negamax value of a position at or past the depth limit (already counted
+        as an expanded node). A quiet position is evaluated; while the player to
+        move has a capture, the captures are searched instead, with alpha-beta.
+        Captures are forced, so there is no "stand pat" score, and every capture
+        removes a piece, so the search ends.
+        
+        Args:
+            board: Current board state
+            alpha: Alpha value for pruning
+            beta: Beta value for pruning
+            
+        Returns:
+            Optional[float]: Value for the player to move, or None if time limit exceeded
+        """
+        to_move = board.PlayerToMove
+        if not (self.UseQuiescence and board.HasCapture(to_move)):
+            return self._Evaluate(board, to_move)
+        v = _NEG_INF
+        moves = board.GenerateLegalMoves(to_move)
         self.NodesGenerated += len(moves)
-        # optional ordering
-        if use_ordering:
-            scored = []
-            for mv in moves:
-                succ = board.ApplyMove(mv)
-                scored.append((succ.EvaluateFor(root_player), mv))
-            scored.sort(key=lambda x: x[0], reverse=True)
-            moves = [mv for (_, mv) in scored]
+        make, unmake = board.MakeMove, board.UnmakeMove
+        time_remaining, quiescence = self._TimeRemaining, self._Quiescence
         for mv in moves:
-            succ = board.ApplyMove(mv)
-            val = self._AlphaBetaMin(succ, depth + 1, alpha, beta, root_player, use_ordering)
+            if not time_remaining():
+                self.TimeUp = True
+                return None
+            self.NodesExpanded += 1
+            undo = make(mv)
+            val = quiescence(board, -beta, -alpha)
+            unmake(undo)
             if val is None:
                 return None
-            v = max(v, val)
+            val = -val
+            if val > v:
+                v = val
             if v >= beta:
                 self.AlphaBetaPrunes += 1
-                return v
-            alpha = max(alpha, v)
+                break
+            if v > alpha:
+                alpha = v
         return v
 
-    def _AlphaBetaMin(self, board: GameBoard, depth: int, alpha: float, beta: float,
-                      root_player: str, use_ordering: bool) -> Optional[float]:
+    def _Negamax(self, board: GameBoard, depth: int, alpha: float, beta: float,
+                 use_ordering: bool) -> Optional[float]:
         """
-        Alpha-beta minimizing node.
+        Alpha-beta node in negamax form: values are from the point of view of the
+        player to move, so each child's value is negated and searched with the
+        window (-beta, -alpha), and every node maximizes.
         
         Args:
             board: Current board state
             depth: Current search depth
             alpha: Alpha value for pruning
             beta: Beta value for pruning
-            root_player: Original player at root of search tree
             use_ordering: Whether to use node ordering
             
         Returns:
-            Optional[float]: Minimum value or None if time limit exceeded
+            Optional[float]: Value for the player to move, or None if time limit exceeded
         """
         if not self._TimeRemaining():
             self.TimeUp = True
             return None
         self.NodesExpanded += 1
-        winner = board.GoalTest()
-        if winner is not None:
-            return float('inf') if winner == root_player else float('-inf')
-        if depth >= self.MaxPly:
-            return board.EvaluateFor(root_player)
-        v = math.inf
+        depth_limit = self.DepthLimit
+        if depth >= depth_limit:
+            return self._Quiescence(board, alpha, beta)
+        remaining = depth_limit - depth
+        alpha0, beta0 = alpha, beta
+        tt_move = None
+        if self.UseTransTable:
+            tt_value, alpha, beta, tt_move = self._ProbeTransposition(board, remaining, alpha, beta)
+            if tt_value is not None:
+                self.TranspositionHits += 1
+                return tt_value
+        v = _NEG_INF
+        best = None
         moves = board.GenerateLegalMoves(board.PlayerToMove)
         self.NodesGenerated += len(moves)
+        if not moves:
+            return v  # no legal moves (or no pieces): the player to move has lost
+        # optional ordering
         if use_ordering:
-            scored = []
-            for mv in moves:
-                succ = board.ApplyMove(mv)
-                scored.append((succ.EvaluateFor(root_player), mv))
-            # For minimizing node, order ascending to get cutoffs faster
-            scored.sort(key=lambda x: x[0])
-            moves = [mv for (_, mv) in scored]
+            self._OrderMoves(board, moves, depth, tt_move)
+        leaf = depth + 1 >= depth_limit
+        if leaf:
+            leaf_value = self._LeafValue
+        else:
+            make, unmake, negamax = board.MakeMove, board.UnmakeMove, self._Negamax
         for mv in moves:
-            succ = board.ApplyMove(mv)
-            val = self._AlphaBetaMax(succ, depth + 1, alpha, beta, root_player, use_ordering)
+            if leaf:
+                val = leaf_value(board, mv, -beta, -alpha)
+            else:
+                undo = make(mv)
+                val = negamax(board, depth + 1, -beta, -alpha, use_ordering)
+                unmake(undo)
             if val is None:
                 return None
-            v = min(v, val)
-            if v <= alpha:
+            val = -val
+            if val > v:
+                v = val
+                best = mv
+            if v >= beta:
                 self.AlphaBetaPrunes += 1
-                return v
-            beta = min(beta, v)
+                if use_ordering:
+                    self._RecordCutoff(mv, depth)
+                break
+            if v > alpha:
+                alpha = v
+        if self.UseTransTable:
+            self._StoreTransposition(board, remaining, v, alpha0, beta0, best)
         return v
 
     # -------------------------
@@ -354,7 +701,7 @@ class SearchToolBox:
     def _EstimateOrderingGain(self, board: GameBoard, player: str) -> float:
         """
         Rough estimate of ordering gain (percentage of prunes reduced).
-        We perform two shallow alpha-beta runs at depth min(2,MaxPly) with and without ordering,
+        We perform two shallow alpha-beta runs at depth min(2,DepthLimit) with and without ordering,
         counting prunes. This is only an estimate and kept lightweight to avoid big time cost.
         
         Args:
@@ -365,27 +712,31 @@ class SearchToolBox:
             float: Percentage gain = (prunes_without - prunes_with)/max(1,prunes_without)
         """
         saved_TimeLimit = self.TimeLimit
-        saved_MaxPly = self.MaxPly
+        saved_DepthLimit = self.DepthLimit
         saved_strategy = self.Strategy
+        saved_UseTransTable = self.UseTransTable
+        # Table hits would hide the prunes being compared
+        self.UseTransTable = False
 
         # Run without ordering
         self.TimeLimit = min(0.5, saved_TimeLimit)  # small budget
-        self.MaxPly = min(2, saved_MaxPly)
+        self.DepthLimit = min(2, saved_DepthLimit)
         self.AlphaBetaPrunes = 0
-        self.TimeStart = time.time()
+        self._StartClock()
         self._AlphaBetaTopCountPrunes(board, use_ordering=False, player=player)
 
         prunes_without = self.AlphaBetaPrunes
         # Run with ordering
         self.AlphaBetaPrunes = 0
-        self.TimeStart = time.time()
+        self._StartClock()
         self._AlphaBetaTopCountPrunes(board, use_ordering=True, player=player)
         prunes_with = self.AlphaBetaPrunes
 
         # Restore
         self.TimeLimit = saved_TimeLimit
-        self.MaxPly = saved_MaxPly
+        self.DepthLimit = saved_DepthLimit
         self.Strategy = saved_strategy
+        self.UseTransTable = saved_UseTransTable
 
         if prunes_without == 0:
             return 0.0
@@ -402,11 +753,12 @@ class SearchToolBox:
             player: Player to evaluate for
         """
         moves = board.GenerateLegalMoves(player)
-        alpha = -math.inf
-        beta = math.inf
+        alpha = _NEG_INF
+        beta = _INF
         for mv in moves:
-            succ = board.ApplyMove(mv)
-            val = self._AlphaBetaMin(succ, 1, alpha, beta, player, use_ordering)
+            undo = board.MakeMove(mv)
+            val = self._Negamax(board, 1, -beta, -alpha, use_ordering)
+            board.UnmakeMove(undo)
             if val is None:
                 break
-            alpha = max(alpha, val)
+            alpha = max(alpha, -val)
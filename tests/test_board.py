@@ -0,0 +1,129 @@
+"""
+Regression tests for the bitboard move generator in GameBoard/board.py.
+
+Expected values come from the original list-based generator. Men may also capture
+backwards in this game, so the perft counts differ from English-draughts tables
+from depth 5 on.
+"""
+
+import unittest
+
+from GameBoard.board import GameBoard, ZobristHash
+
+
+def _Position(rows, player):
+    """Build a GameBoard from 8 strings of '.', 'w', 'W', 'b', 'B'."""
+    return GameBoard(board=[[None if ch == '.' else ch for ch in row] for row in rows],
+                     player_to_move=player)
+
+
+def _MoveSet(moves):
+    """Moves as a comparable set of (start, sequence, captures)."""
+    return {(mv['start'], tuple(mv['sequence']), tuple(sorted(mv['captures']))) for mv in moves}
+
+
+def _Perft(board, depth):
+    """Count the move paths of length depth, checking make/unmake and the helpers on the way."""
+    moves = board.GenerateLegalMoves(board.PlayerToMove)
+    if depth == 1:
+        return len(moves)
+    count = 0
+    for mv in moves:
+        before = board.Key() + (board.Hash,)
+        successor = board.SuccessorBitboards(mv)
+        undo = board.MakeMove(mv)
+        assert (board.WhiteMen, board.WhiteKings, board.BlackMen, board.BlackKings) == successor
+        assert board.Hash == ZobristHash(*board.Key())
+        count += _Perft(board, depth - 1)
+        board.UnmakeMove(undo)
+        assert board.Key() + (board.Hash,) == before
+    return count
+
+
+class PerftTest(unittest.TestCase):
+    """Move-path counts from the starting position."""
+
+    # Counts by depth, 1 to 6
+    START_COUNTS = [7, 49, 302, 1469, 7482, 37986]
+
+    def test_StartPosition(self):
+        for player in ('w', 'b'):
+            for depth, expected in enumerate(self.START_COUNTS, 1):
+                with self.subTest(player=player, depth=depth):
+                    self.assertEqual(_Perft(GameBoard(player_to_move=player), depth), expected)
+
+
+class FixedPositionTest(unittest.TestCase):
+    """Legal moves of hand-picked positions, and the helpers that must agree with them."""
+
+    CASES = [
+        # Quiet moves only; a black king moves in all four directions
+        ((".b.b...b",
+          "b.b.....",
+          "........",
+          "b.......",
+          "........",
+          "..w.....",
+          ".....B.w",
+          "w......."), 'b',
+         {((0, 3), ((1, 4),), ()), ((0, 7), ((1, 6),), ()), ((1, 0), ((2, 1),), ()),
+          ((1, 2), ((2, 1),), ()), ((1, 2), ((2, 3),), ()), ((3, 0), ((4, 1),), ()),
+          ((6, 5), ((5, 4),), ()), ((6, 5), ((5, 6),), ()), ((6, 5), ((7, 4),), ()),
+          ((6, 5), ((7, 6),), ())}),
+        # Double jumps by a man, the second one backwards
+        (("...b.b.b",
+          "....b.b.",
+          "...b...b",
+          "b.......",
+          ".w.w....",
+          "w.......",
+          ".w.w...w",
+          "..w.w.w."), 'b',
+         {((3, 0), ((5, 2), (3, 4)), ((4, 1), (4, 3))),
+          ((3, 0), ((5, 2), (7, 0)), ((4, 1), (6, 1)))}),
+        # A man's backward capture is forced over every quiet move
+        ((".....b.b",
+          "......b.",
+          "...b....",
+          "........",
+          ".....b..",
+          "w.......",
+          ".B.w...B",
+          "........"), 'w',
+         {((5, 0), ((7, 2),), ((6, 1),))}),
+        # Double jump by a king
+        ((".b......",
+          "........",
+          "...w...W",
+          "........",
+          ".......w",
+          "..w.w...",
+          ".B......",
+          "w...w.w."), 'b',
+         {((6, 1), ((4, 3), (6, 5)), ((5, 2), (5, 4)))}),
+    ]
+
+    def test_LegalMoves(self):
+        for rows, player, expected in self.CASES:
+            with self.subTest(rows=rows):
+                board = _Position(rows, player)
+                moves = board.GenerateLegalMoves(player)
+                self.assertEqual(_MoveSet(moves), expected)
+                self.assertEqual(len(moves), len(expected))
+                self.assertEqual(board.CountLegalMoves(player), len(expected))
+                self.assertEqual(board.HasCapture(player), bool(moves[0]['captures']))
+
+    def test_ApplyMoveMatchesMakeMove(self):
+        for rows, player, _ in self.CASES:
+            board = _Position(rows, player)
+            for mv in board.GenerateLegalMoves(player):
+                with self.subTest(rows=rows, move=mv):
+                    successor = board.ApplyMove(mv)
+                    undo = board.MakeMove(mv)
+                    self.assertEqual(board.Key() + (board.Hash,), successor.Key() + (successor.Hash,))
+                    board.UnmakeMove(undo)
+                    self.assertEqual(board.Board, [[None if ch == '.' else ch for ch in row] for row in rows])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Regression tests for the quiescence search in SearchToolBox/search.py: positions
+at the depth limit with a capture pending are searched on until they are quiet.
+"""
+
+import math
+import random
+import unittest
+
+from GameBoard.board import GameBoard
+from SearchToolBox.search import SearchToolBox
+
+
+def _Agent(strategy, depth):
+    """A SearchToolBox ready to call its search routines directly, without a time limit."""
+    agent = SearchToolBox(strategy, TimeLimit=1000.0, MaxPly=depth)
+    agent.UseTransTable = False
+    agent.DepthLimit = depth
+    agent.Killers = [[None, None] for _ in range(depth + 1)]
+    agent._StartClock()
+    return agent
+
+
+def _CaptureValue(board):
+    """Reference quiescence: full negamax over captures, no pruning, no caches."""
+    player = board.PlayerToMove
+    if not board.CountLegalMoves(player):
+        return -math.inf  # no pieces or no legal move: the side to move has lost
+    if not board.HasCapture(player):
+        return board.EvaluateFor(player)
+    return max(-_CaptureValue(board.ApplyMove(mv)) for mv in board.GenerateLegalMoves(player))
+
+
+def _Positions(seed, count, with_capture):
+    """Positions from seeded random games, with or without a capture for the side to move."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = GameBoard()
+        for _ in range(rng.randrange(6, 40)):
+            moves = board.GenerateLegalMoves(board.PlayerToMove)
+            if not moves:
+                break
+            board = board.ApplyMove(rng.choice(moves))
+        if (board.GenerateLegalMoves(board.PlayerToMove)
+                and board.HasCapture(board.PlayerToMove) == with_capture):
+            positions.append(board)
+    return positions
+
+
+class QuiescenceTest(unittest.TestCase):
+    """SearchToolBox._Quiescence against a plain capture search."""
+
+    def test_QuietPositionIsEvaluated(self):
+        agent = _Agent("AlphaBeta", 1)
+        for board in [GameBoard()] + _Positions(1, 10, with_capture=False):
+            self.assertEqual(agent._Quiescence(board, -math.inf, math.inf),
+                             board.EvaluateFor(board.PlayerToMove))
+
+    def test_CapturesAreResolved(self):
+        agent = _Agent("AlphaBeta", 1)
+        for board in _Positions(2, 20, with_capture=True):
+            with self.subTest(board=board.Key()):
+                self.assertEqual(agent._Quiescence(board, -math.inf, math.inf), _CaptureValue(board))
+
+    def test_WinningCapture(self):
+        # White's capture takes Black's last piece
+        rows = ["........",
+                "........",
+                "........",
+                "........",
+                "...b....",
+                "..w.....",
+                "........",
+                "........"]
+        board = GameBoard(board=[[None if ch == '.' else ch for ch in row] for row in rows],
+                          player_to_move='w')
+        agent = _Agent("AlphaBeta", 1)
+        self.assertEqual(agent._Quiescence(board, -math.inf, math.inf), math.inf)
+        self.assertEqual(_CaptureValue(board), math.inf)
+        self.assertEqual(board.ApplyMove(board.GenerateLegalMoves('w')[0]).EvaluateFor('b'), -math.inf)
+
+    def test_CanBeTurnedOff(self):
+        agent = _Agent("AlphaBeta", 1)
+        agent.UseQuiescence = False
+        for board in _Positions(3, 10, with_capture=True):
+            self.assertEqual(agent._Quiescence(board, -math.inf, math.inf),
+                             board.EvaluateFor(board.PlayerToMove))
+
+
+class SearchAgreementTest(unittest.TestCase):
+    """Minimax and both alpha-beta searches extend the same captures, so they agree on values."""
+
+    DEPTH = 3
+
+    def test_RootValues(self):
+        for board in _Positions(4, 8, with_capture=False) + _Positions(5, 8, with_capture=True):
+            player = board.PlayerToMove
+            with self.subTest(board=board.Key()):
+                minimax = _Agent("Minimax", self.DEPTH)._MaxValue(board, 0, player)
+                for strategy, use_ordering in (("AlphaBeta", False), ("AlphaBetaOrdering", True)):
+                    agent = _Agent(strategy, self.DEPTH)
+                    self.assertEqual(agent._Negamax(board, 0, -math.inf, math.inf, use_ordering), minimax)
+
+
+if __name__ == '__main__':
+    unittest.main()